@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+DKDC Policy Batch Prefilter
+Numeric fast path of the policy guard for gateway-scale token batches
+"""
+
+import hashlib
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Run the kernel as plain Python when numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    prange = range
+
+from engine.policy_guard import _LLC_RANK
+
+# Row layout for batch evaluation (structure of arrays via numpy record fields)
+BATCH_DTYPE = np.dtype([
+    ("exp", "f8"),
+    ("now", "f8"),
+    ("req_llc", "i1"),
+    ("auth_llc", "i1"),
+    ("jti_hash", "u8"),
+])
+
+# LLC sentinels; real levels come from _LLC_RANK and are >= 0
+LLC_UNSET = -1
+LLC_INVALID = -2
+
+def jti_hash(jti: str) -> int:
+    """64-bit token identifier used by the batch kernel"""
+    return int.from_bytes(hashlib.blake2b(jti.encode("utf-8"), digest_size=8).digest(), "big")
+
+def llc_code(llc: str) -> int:
+    """Encode an LLC value for the batch kernel"""
+    if not llc:
+        return LLC_UNSET
+    return _LLC_RANK.get(llc, LLC_INVALID)
+
+def pack_contexts(inputs: Iterable[Dict]) -> np.ndarray:
+    """Pack policy inputs (as passed to PolicyGuard.evaluate) into BATCH_DTYPE rows"""
+    rows = []
+    for input_data in inputs:
+        request = input_data.get("request", {})
+        cct = input_data.get("cct", {})
+        rows.append((
+            cct.get("exp", 0),
+            input_data["now"],
+            llc_code(request.get("llc", "")),
+            llc_code(cct.get("dkdc", {}).get("llc", "")),
+            jti_hash(cct.get("jti", "")),
+        ))
+    return np.array(rows, dtype=BATCH_DTYPE)
+
+@njit(parallel=True, cache=True)
+def _violation_kernel(exp, now, req_llc, auth_llc, jti_hashes, revoked_sorted):
+    n = exp.shape[0]
+    mask = np.zeros(n, dtype=np.bool_)
+    n_revoked = revoked_sorted.shape[0]
+    for i in prange(n):
+        if now[i] > exp[i]:
+            mask[i] = True
+            continue
+        req = req_llc[i]
+        auth = auth_llc[i]
+        if req != LLC_UNSET and auth != LLC_UNSET:
+            if req == LLC_INVALID or auth == LLC_INVALID or req > auth:
+                mask[i] = True
+                continue
+        if n_revoked:
+            pos = np.searchsorted(revoked_sorted, jti_hashes[i])
+            if pos < n_revoked and revoked_sorted[pos] == jti_hashes[i]:
+                mask[i] = True
+    return mask
+
+def _revoked_hashes(revoked_tokens: Optional[Iterable[str]]) -> np.ndarray:
+    """Sorted 64-bit hashes of revoked token identifiers"""
+    return np.sort(np.fromiter(
+        (jti_hash(jti) for jti in (revoked_tokens or ())), dtype=np.uint64
+    ))
+
+def evaluate_many(exps: np.ndarray, nows: np.ndarray, req_llc: np.ndarray,
+                  auth_llc: np.ndarray, jti_hashes: np.ndarray,
+                  revoked_tokens: Optional[Iterable[str]] = None) -> np.ndarray:
+    """Vectorized NumPy equivalent of the batch kernel over column arrays
+
+    Suited to audit replays and CRL rescans over historical decisions; needs
+    numpy only.
+    """
+    expired = nows > exps
+    llc_set = (req_llc != LLC_UNSET) & (auth_llc != LLC_UNSET)
+    llc_bad = llc_set & ((req_llc == LLC_INVALID) | (auth_llc == LLC_INVALID) | (req_llc > auth_llc))
+    revoked = np.isin(jti_hashes, _revoked_hashes(revoked_tokens))
+    return expired | llc_bad | revoked
+
+def evaluate_batch(ctxs: np.ndarray, revoked_tokens: Optional[Iterable[str]] = None) -> np.ndarray:
+    """Flag rows that fail the expiry, LLC or revocation rules
+
+    Only the numeric rules are evaluated here. Rows left unflagged must still
+    go through PolicyGuard.evaluate for the scope, export and redaction rules.
+    Without numba the vectorized NumPy path is used instead of the kernel.
+    """
+    if not NUMBA_AVAILABLE:
+        return evaluate_many(ctxs["exp"], ctxs["now"], ctxs["req_llc"],
+                             ctxs["auth_llc"], ctxs["jti_hash"], revoked_tokens)
+
+    revoked_sorted = _revoked_hashes(revoked_tokens)
+    return _violation_kernel(
+        np.ascontiguousarray(ctxs["exp"]),
+        np.ascontiguousarray(ctxs["now"]),
+        np.ascontiguousarray(ctxs["req_llc"]),
+        np.ascontiguousarray(ctxs["auth_llc"]),
+        np.ascontiguousarray(ctxs["jti_hash"]),
+        revoked_sorted,
+    )
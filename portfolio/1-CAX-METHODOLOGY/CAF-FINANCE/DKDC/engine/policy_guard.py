@@ -5,60 +5,350 @@ OPA/Rego-style policy enforcement for CCT tokens
 """
 
 import json
+import re
+import fnmatch
 import time
-from typing import Dict, List, Any, Optional
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 
-@dataclass
+# LLC hierarchy rank (higher levels include lower)
+_LLC_RANK: Dict[str, int] = {"ephemeral": 0, "session": 1, "project": 2, "portfolio": 3}
+
+# Sensitive data patterns per redaction vector (simplified)
+_REDACTION_PATTERNS: Dict[str, str] = {
+    "/secrets": r"(?:secret|password|token|key)\s*[:=]",
+    "/personal": r"(?:ssn|phone|address|email)\s*[:=]",
+    "/credentials": r"(?:api[-_]?key|access[-_]?token)",
+}
+
+@lru_cache(maxsize=64)
+def _redaction_regex(vectors: Tuple[str, ...]) -> Optional["re.Pattern"]:
+    """Single alternation regex over the patterns of the given vectors"""
+    groups = [
+        f"(?P<{vector.strip('/')}>{_REDACTION_PATTERNS[vector]})"
+        for vector in dict.fromkeys(vectors) if vector in _REDACTION_PATTERNS
+    ]
+    if not groups:
+        return None
+    return re.compile("|".join(groups), re.IGNORECASE)
+
+@dataclass(frozen=True, slots=True)
 class PolicyViolation:
     """Policy enforcement violation"""
     rule: str
     message: str
     severity: str = "error"  # error, warning, info
 
+# Template for per-token evaluators built by PolicyGuard._get_specialized
+_SPECIALIZED_TEMPLATE = """
+def _specialized_eval(request, scopes):
+    violations = []
+    rule_name = ""
+    try:
+{blocks}
+    except Exception as e:
+        violations.append(PolicyViolation(
+            rule=rule_name,
+            message=f"Rule evaluation error: {{e}}",
+            severity="error"
+        ))
+    return violations
+"""
+
+_SPECIALIZED_BLOCK = """
+        rule_name = {rule!r}
+        violation = None
+{body}
+        if violation is not None:
+            violations.append(violation)
+"""
+
+def _hash_request(request: Dict) -> int:
+    """Stable 64-bit fingerprint of a request (or claims) payload"""
+    payload = json.dumps(request, sort_keys=True, default=str).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(payload, digest_size=8).digest(), "big")
+
 class PolicyGuard:
     """Policy enforcement engine for DKDC"""
     
-    def __init__(self):
-        self.rules = {
-            "scope_authorization": self._check_scope_authorization,
-            "export_controls": self._check_export_controls,
-            "token_expiry": self._check_token_expiry,
-            "revocation_status": self._check_revocation_status,
-            "llc_compliance": self._check_llc_compliance,
-            "redaction_enforcement": self._check_redaction_enforcement
-        }
+    def __init__(self, cache_maxsize: int = 1024, cache_ttl: float = 30.0):
+        # Recent evaluations keyed by (jti, claims fingerprint, request fingerprint)
+        self._eval_cache: "OrderedDict[Tuple[str, int, int], Tuple[float, bool, List[PolicyViolation]]]" = OrderedDict()
+        self.cache_maxsize = cache_maxsize
+        self.cache_ttl = cache_ttl
+        # Redaction scan results keyed by content fingerprint + vectors
+        self._redaction_cache: "OrderedDict[bytes, Optional[PolicyViolation]]" = OrderedDict()
+        self.redaction_cache_maxsize = 4096
+        # Per-token evaluators with the CCT claims bound as constants, keyed by
+        # (jti, claims fingerprint, exp)
+        self._specialized_cache: "OrderedDict[Tuple[str, int, float], Callable[..., List[PolicyViolation]]]" = OrderedDict()
+        # (name, rule, estimated relative cost), cheapest first so the
+        # regex/fnmatch rules run last
+        self.rules: List[Tuple[str, Callable[..., Optional[PolicyViolation]], int]] = sorted([
+            ("token_expiry", self._check_token_expiry, 1),
+            ("revocation_status", self._check_revocation_status, 1),
+            ("llc_compliance", self._check_llc_compliance, 2),
+            ("export_controls", self._check_export_controls, 2),
+            ("scope_authorization", self._check_scope_authorization, 5),
+            ("redaction_enforcement", self._check_redaction_enforcement, 20)
+        ], key=lambda rule: rule[2])
     
     def evaluate(self, input_data: Dict) -> List[PolicyViolation]:
-        """Evaluate policy rules against input"""
-        violations = []
+        """Evaluate policy rules against input, reusing recent results per token"""
+        try:
+            args = self._validate_input(input_data)
+        except (TypeError, AttributeError) as e:
+            return [PolicyViolation(
+                rule="input_validation",
+                message=f"Malformed policy input: {e}",
+                severity="error"
+            )]
         
-        for rule_name, rule_func in self.rules.items():
-            try:
-                violation = rule_func(input_data)
-                if violation:
-                    violations.append(violation)
-            except Exception as e:
-                violations.append(PolicyViolation(
-                    rule=rule_name,
-                    message=f"Rule evaluation error: {e}",
-                    severity="error"
-                ))
+        request, cct, cct_dkdc, now, revoked, _scopes = args
+        jti = cct.get("jti", "")
+        
+        # Tokens without a jti cannot be told apart, so they are never cached
+        if not jti or self.cache_maxsize <= 0:
+            return self._evaluate_rules(args)
+        
+        try:
+            is_revoked = jti in revoked
+            expired = now > cct.get("exp", 0)
+            # The claims are part of the key: a jti reused with other
+            # claims must not be served the first token's result
+            key = (jti, _hash_request(cct_dkdc), _hash_request(request))
+            hash(key)
+            deadline = now + self.cache_ttl
+        except (TypeError, ValueError):
+            # Uncacheable input (unhashable jti, non-container revocation
+            # list, non-numeric exp/now, unsortable request keys); the
+            # rules still run and report it fail-closed
+            return self._evaluate_rules(args)
+        
+        if is_revoked:
+            self._invalidate(jti)
+            return self._evaluate_rules(args)
+        
+        cached = self._eval_cache.get(key)
+        if cached is not None:
+            deadline, was_expired, violations = cached
+            # Expiry is re-checked against the live token so a cached
+            # approval never outlives the CCT itself
+            if now <= deadline and was_expired == expired:
+                self._eval_cache.move_to_end(key)
+                return list(violations)
+            del self._eval_cache[key]
+        
+        violations = self._evaluate_token(jti, args)
+        self._eval_cache[key] = (deadline, expired, list(violations))
+        if len(self._eval_cache) > self.cache_maxsize:
+            self._eval_cache.popitem(last=False)
         
         return violations
     
-    def _check_scope_authorization(self, input_data: Dict) -> Optional[PolicyViolation]:
-        """Check if requested scopes are authorized"""
+    def _validate_input(self, input_data: Dict) -> Tuple[Dict, Dict, Dict, float, Any, Tuple[str, ...]]:
+        """Extract and type-check the fields shared by every rule
+        
+        Requested scopes are normalized here to a tuple (a single scope may
+        be given as a string) so rules never re-parse them.
+        """
         request = input_data.get("request", {})
         cct = input_data.get("cct", {})
+        if not isinstance(request, dict):
+            raise TypeError("request must be a mapping")
+        if not isinstance(cct, dict):
+            raise TypeError("cct must be a mapping")
+        
+        cct_dkdc = cct.get("dkdc", {})
+        if not isinstance(cct_dkdc, dict):
+            raise TypeError("cct.dkdc must be a mapping")
+        
+        scopes = request.get("scopes") or ()
+        if isinstance(scopes, str):
+            scopes = (scopes,)
+        elif isinstance(scopes, (list, tuple)):
+            scopes = tuple(scopes)
+        else:
+            raise TypeError("request.scopes must be a string or a list")
+        
+        now = input_data.get("now", time.time())
+        revoked = input_data.get("revoked_tokens", set())
+        return request, cct, cct_dkdc, now, revoked, scopes
+    
+    def _invalidate(self, jti: str) -> None:
+        """Drop cached evaluations for a revoked token"""
+        for key in [k for k in self._eval_cache if k[0] == jti]:
+            del self._eval_cache[key]
+        for key in [k for k in self._specialized_cache if k[0] == jti]:
+            del self._specialized_cache[key]
+    
+    def _evaluate_token(self, jti: str, args: Tuple) -> List[PolicyViolation]:
+        """Evaluate a live, unrevoked token through its specialized evaluator"""
+        request, cct, cct_dkdc, now, _revoked, scopes = args
+        evaluator = self._get_specialized(jti, cct, cct_dkdc, now)
+        if evaluator is None:
+            return self._evaluate_rules(args)
+        return evaluator(request, scopes)
+    
+    def _get_specialized(self, jti: str, cct: Dict, cct_dkdc: Dict,
+                         now: float) -> Optional[Callable[..., List[PolicyViolation]]]:
+        """Return the evaluator for a token, generating it on first use
+        
+        The claims are compiled in as constants. Signatures are not verified
+        here, so a jti alone does not pin the claims: evaluators are keyed by
+        jti, a fingerprint of the claims and exp. Expired tokens always take
+        the generic path and entries are dropped on expiry and revocation,
+        so the expiry and revocation rules are not generated.
+        """
+        # Expiry is checked against the live token, as for the result cache
+        exp = cct.get("exp", 0)
+        if now > exp:
+            return None
+        
+        try:
+            key = (jti, _hash_request(cct_dkdc), exp)
+            evaluator = self._specialized_cache.get(key)
+        except TypeError:
+            return None
+        if evaluator is not None:
+            self._specialized_cache.move_to_end(key)
+            return evaluator
+        
+        # Evaluators of expired tokens sharing this jti are no longer reachable
+        for stale in [k for k in self._specialized_cache if k[0] == jti and now > k[2]]:
+            del self._specialized_cache[stale]
+        
+        try:
+            evaluator = self._build_specialized(cct_dkdc)
+        except Exception:
+            evaluator = None
+        if evaluator is None:
+            return None
+        
+        self._specialized_cache[key] = evaluator
+        if len(self._specialized_cache) > self.cache_maxsize:
+            self._specialized_cache.popitem(last=False)
+        return evaluator
+    
+    def _build_specialized(self, cct_dkdc: Dict) -> Optional[Callable[..., List[PolicyViolation]]]:
+        """Generate and compile an evaluator with the token's claims bound in
+        
+        Returns None when the rule set has been customized, since only the
+        built-in rules can be specialized.
+        """
+        namespace: Dict[str, Any] = {
+            "PolicyViolation": PolicyViolation,
+            "_LLC_RANK": _LLC_RANK,
+            "fnmatch": fnmatch.fnmatch,
+        }
+        blocks = []
+        
+        for rule_name, rule_func, _cost in self.rules:
+            if getattr(rule_func, "__func__", None) is not getattr(PolicyGuard, f"_check_{rule_name}", None):
+                return None
+            
+            if rule_name in ("token_expiry", "revocation_status"):
+                continue
+            
+            if rule_name == "llc_compliance":
+                authorized_llc = cct_dkdc.get("llc", "")
+                if not authorized_llc:
+                    continue
+                auth_level = _LLC_RANK.get(authorized_llc)
+                namespace["_AUTH_LLC"] = authorized_llc
+                body = (
+                    "        requested_llc = request.get(\"llc\", \"\")\n"
+                    "        if requested_llc:\n"
+                    "            req_level = _LLC_RANK.get(requested_llc)\n"
+                    "            if req_level is None:\n"
+                    "                violation = PolicyViolation(rule=\"llc_compliance\", message=f\"Invalid LLC value: {requested_llc}\")\n"
+                )
+                if auth_level is None:
+                    body += (
+                        "            else:\n"
+                        "                violation = PolicyViolation(rule=\"llc_compliance\", message=f\"Invalid LLC value: {_AUTH_LLC}\")\n"
+                    )
+                else:
+                    body += (
+                        f"            elif req_level > {auth_level!r}:\n"
+                        "                violation = PolicyViolation(rule=\"llc_compliance\", "
+                        "message=f\"Requested LLC '{requested_llc}' exceeds authorized '{_AUTH_LLC}'\")\n"
+                    )
+            
+            elif rule_name == "export_controls":
+                export_controls = cct_dkdc.get("export", {})
+                denied = {}
+                if not export_controls.get("internet", False):
+                    denied["export:internet"] = PolicyViolation(
+                        rule="export_controls", message="Internet export disabled by CCT")
+                if not export_controls.get("third_party", False):
+                    denied["export:third_party"] = PolicyViolation(
+                        rule="export_controls", message="Third-party export disabled by CCT")
+                if not export_controls.get("model_to_model", True):
+                    denied["share:model"] = PolicyViolation(
+                        rule="export_controls", message="Model-to-model sharing disabled by CCT")
+                if not denied:
+                    continue
+                namespace["_EXPORT_DENIED"] = denied
+                body = "        violation = _EXPORT_DENIED.get(request.get(\"action\", \"\"))\n"
+            
+            elif rule_name == "scope_authorization":
+                authorized_scopes = tuple(cct_dkdc.get("scopes", []))
+                namespace["_EXACT_SCOPES"] = frozenset(authorized_scopes)
+                namespace["_WILDCARD_SCOPES"] = tuple(a for a in authorized_scopes if "*" in a)
+                body = (
+                    "        for scope in scopes:\n"
+                    "            if scope not in _EXACT_SCOPES and not any(fnmatch(scope, a) for a in _WILDCARD_SCOPES):\n"
+                    "                violation = PolicyViolation(rule=\"scope_authorization\", "
+                    "message=f\"Scope '{scope}' not authorized by CCT\")\n"
+                    "                break\n"
+                )
+            
+            elif rule_name == "redaction_enforcement":
+                if not cct_dkdc.get("redaction_vectors", []):
+                    continue
+                namespace["_check_redaction"] = self._check_redaction_enforcement
+                namespace["_DKDC"] = {"redaction_vectors": list(cct_dkdc["redaction_vectors"])}
+                body = "        violation = _check_redaction(request, None, _DKDC, None, None, scopes)\n"
+            
+            blocks.append(_SPECIALIZED_BLOCK.format(rule=rule_name, body=body))
+        
+        source = _SPECIALIZED_TEMPLATE.format(blocks="".join(blocks) or "        pass\n")
+        exec(compile(source, "<dkdc-policy-specialized>", "exec"), namespace)
+        return namespace["_specialized_eval"]
+    
+    def _evaluate_rules(self, args: Tuple) -> List[PolicyViolation]:
+        """Run policy rules against validated input in ascending cost order
         
-        requested_scopes = request.get("scopes", [])
-        if isinstance(requested_scopes, str):
-            requested_scopes = [requested_scopes]
+        A rule that raises is reported as a violation and ends evaluation,
+        so a broken rule can never turn into an implicit allow.
+        """
+        violations = []
+        rule_name = ""
         
-        authorized_scopes = cct.get("dkdc", {}).get("scopes", [])
+        try:
+            for rule_name, rule_func, _cost in self.rules:
+                violation = rule_func(*args)
+                if violation:
+                    violations.append(violation)
+        except Exception as e:
+            violations.append(PolicyViolation(
+                rule=rule_name,
+                message=f"Rule evaluation error: {e}",
+                severity="error"
+            ))
         
-        for scope in requested_scopes:
+        return violations
+    
+    def _check_scope_authorization(self, request: Dict, cct: Dict, cct_dkdc: Dict,
+                                   now: float, revoked: Any, scopes: Tuple[str, ...]) -> Optional[PolicyViolation]:
+        """Check if requested scopes are authorized"""
+        authorized_scopes = cct_dkdc.get("scopes", [])
+        
+        for scope in scopes:
             if not self._scope_authorized(scope, authorized_scopes):
                 return PolicyViolation(
                     rule="scope_authorization",
@@ -67,13 +357,11 @@ class PolicyGuard:
         
         return None
     
-    def _check_export_controls(self, input_data: Dict) -> Optional[PolicyViolation]:
+    def _check_export_controls(self, request: Dict, cct: Dict, cct_dkdc: Dict,
+                               now: float, revoked: Any, scopes: Tuple[str, ...]) -> Optional[PolicyViolation]:
         """Check export control compliance"""
-        request = input_data.get("request", {})
-        cct = input_data.get("cct", {})
-        
         action = request.get("action", "")
-        export_controls = cct.get("dkdc", {}).get("export", {})
+        export_controls = cct_dkdc.get("export", {})
         
         # Check internet export
         if action == "export:internet":
@@ -101,11 +389,9 @@ class PolicyGuard:
         
         return None
     
-    def _check_token_expiry(self, input_data: Dict) -> Optional[PolicyViolation]:
+    def _check_token_expiry(self, request: Dict, cct: Dict, cct_dkdc: Dict,
+                            now: float, revoked: Any, scopes: Tuple[str, ...]) -> Optional[PolicyViolation]:
         """Check token expiration"""
-        cct = input_data.get("cct", {})
-        now = input_data.get("now", time.time())
-        
         exp = cct.get("exp", 0)
         
         if now > exp:
@@ -116,14 +402,12 @@ class PolicyGuard:
         
         return None
     
-    def _check_revocation_status(self, input_data: Dict) -> Optional[PolicyViolation]:
+    def _check_revocation_status(self, request: Dict, cct: Dict, cct_dkdc: Dict,
+                                 now: float, revoked: Any, scopes: Tuple[str, ...]) -> Optional[PolicyViolation]:
         """Check if token is revoked"""
-        cct = input_data.get("cct", {})
-        revoked_tokens = input_data.get("revoked_tokens", set())
-        
         jti = cct.get("jti", "")
         
-        if jti in revoked_tokens:
+        if jti in revoked:
             return PolicyViolation(
                 rule="revocation_status",
                 message="CCT token has been revoked"
@@ -131,60 +415,68 @@ class PolicyGuard:
         
         return None
     
-    def _check_llc_compliance(self, input_data: Dict) -> Optional[PolicyViolation]:
+    def _check_llc_compliance(self, request: Dict, cct: Dict, cct_dkdc: Dict,
+                              now: float, revoked: Any, scopes: Tuple[str, ...]) -> Optional[PolicyViolation]:
         """Check Lifecycle Level Context compliance"""
-        request = input_data.get("request", {})
-        cct = input_data.get("cct", {})
-        
         requested_llc = request.get("llc", "")
-        authorized_llc = cct.get("dkdc", {}).get("llc", "")
-        
-        # Define LLC hierarchy (higher levels include lower)
-        llc_hierarchy = ["ephemeral", "session", "project", "portfolio"]
+        authorized_llc = cct_dkdc.get("llc", "")
         
         if requested_llc and authorized_llc:
-            try:
-                req_level = llc_hierarchy.index(requested_llc)
-                auth_level = llc_hierarchy.index(authorized_llc)
-                
-                if req_level > auth_level:
-                    return PolicyViolation(
-                        rule="llc_compliance",
-                        message=f"Requested LLC '{requested_llc}' exceeds authorized '{authorized_llc}'"
-                    )
-            except ValueError:
+            req_level = _LLC_RANK.get(requested_llc)
+            auth_level = _LLC_RANK.get(authorized_llc)
+            
+            if req_level is None or auth_level is None:
+                invalid_llc = requested_llc if req_level is None else authorized_llc
+                return PolicyViolation(
+                    rule="llc_compliance",
+                    message=f"Invalid LLC value: {invalid_llc}"
+                )
+            
+            if req_level > auth_level:
                 return PolicyViolation(
                     rule="llc_compliance",
-                    message=f"Invalid LLC value: {requested_llc or authorized_llc}"
+                    message=f"Requested LLC '{requested_llc}' exceeds authorized '{authorized_llc}'"
                 )
         
         return None
     
-    def _check_redaction_enforcement(self, input_data: Dict) -> Optional[PolicyViolation]:
+    def _check_redaction_enforcement(self, request: Dict, cct: Dict, cct_dkdc: Dict,
+                                     now: float, revoked: Any, scopes: Tuple[str, ...]) -> Optional[PolicyViolation]:
         """Check redaction enforcement"""
-        request = input_data.get("request", {})
-        cct = input_data.get("cct", {})
-        
         content = request.get("content", "")
-        redaction_vectors = cct.get("dkdc", {}).get("redaction_vectors", [])
+        redaction_vectors = cct_dkdc.get("redaction_vectors", [])
         
-        # Check if sensitive patterns are present (simplified)
-        sensitive_patterns = {
-            "/secrets": r"(?:secret|password|token|key)\s*[:=]",
-            "/personal": r"(?:ssn|phone|address|email)\s*[:=]",
-            "/credentials": r"(?:api[-_]?key|access[-_]?token)"
-        }
+        if not content or not redaction_vectors:
+            return None
         
-        for vector in redaction_vectors:
-            if vector in sensitive_patterns:
-                import re
-                pattern = sensitive_patterns[vector]
-                if re.search(pattern, content, re.IGNORECASE):
-                    return PolicyViolation(
-                        rule="redaction_enforcement",
-                        message=f"Sensitive data detected, redaction required: {vector}",
-                        severity="warning"
-                    )
+        # Repeated content (templates, system prompts) skips the regex scan
+        key = hashlib.blake2b(
+            content.encode("utf-8"), digest_size=16, key=b"dkdc-redact"
+        ).digest() + "\0".join(redaction_vectors).encode("utf-8")
+        if key in self._redaction_cache:
+            self._redaction_cache.move_to_end(key)
+            return self._redaction_cache[key]
+        
+        violation = self._scan_redaction(content, redaction_vectors)
+        self._redaction_cache[key] = violation
+        if len(self._redaction_cache) > self.redaction_cache_maxsize:
+            self._redaction_cache.popitem(last=False)
+        
+        return violation
+    
+    def _scan_redaction(self, content: str, redaction_vectors: List[str]) -> Optional[PolicyViolation]:
+        """Scan content once for the sensitive patterns of all redaction vectors"""
+        pattern = _redaction_regex(tuple(redaction_vectors))
+        if pattern is None:
+            return None
+        
+        match = pattern.search(content)
+        if match:
+            return PolicyViolation(
+                rule="redaction_enforcement",
+                message=f"Sensitive data detected, redaction required: /{match.lastgroup}",
+                severity="warning"
+            )
         
         return None
     
@@ -196,10 +488,8 @@ class PolicyGuard:
                 return True
             
             # Wildcard match
-            if "*" in auth_scope:
-                import fnmatch
-                if fnmatch.fnmatch(requested, auth_scope):
-                    return True
+            if "*" in auth_scope and fnmatch.fnmatch(requested, auth_scope):
+                return True
         
         return False
     
@@ -297,8 +587,10 @@ def example_policy_enforcement():
     
     # Invalid scope request
     print("\n2. Testing unauthorized scope...")
-    invalid_scope_input = valid_input.copy()
-    invalid_scope_input["request"]["scopes"] = ["read:repo:secret-config.yaml"]
+    invalid_scope_input = {
+        **valid_input,
+        "request": {**valid_input["request"], "scopes": ["read:repo:secret-config.yaml"]}
+    }
     
     violations = guard.evaluate(invalid_scope_input)
     print(f"   Violations: {len(violations)}")
@@ -307,8 +599,10 @@ def example_policy_enforcement():
     
     # Export control violation
     print("\n3. Testing export control violation...")
-    export_violation_input = valid_input.copy()
-    export_violation_input["request"]["action"] = "export:internet"
+    export_violation_input = {
+        **valid_input,
+        "request": {**valid_input["request"], "action": "export:internet"}
+    }
     
     violations = guard.evaluate(export_violation_input)
     print(f"   Violations: {len(violations)}")
@@ -317,8 +611,10 @@ def example_policy_enforcement():
     
     # Expired token
     print("\n4. Testing expired token...")
-    expired_token_input = valid_input.copy()
-    expired_token_input["cct"]["exp"] = int(time.time()) - 3600  # Expired 1 hour ago
+    expired_token_input = {
+        **valid_input,
+        "cct": {**valid_input["cct"], "exp": int(time.time()) - 3600}  # Expired 1 hour ago
+    }
     
     violations = guard.evaluate(expired_token_input)
     print(f"   Violations: {len(violations)}")
@@ -4,16 +4,39 @@ DKDC API Client Example
 Demonstrates how to interact with DKDC API endpoints
 """
 
-import json
+import argparse
+import asyncio
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, List
 
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
 class DKDCClient:
     """Client for DKDC API"""
     
-    def __init__(self, base_url: str = "http://localhost:8080"):
+    def __init__(self, base_url: str = "http://localhost:8080",
+                 pool_connections: int = 16, pool_maxsize: int = 64):
         self.base_url = base_url.rstrip("/")
         self.session = requests.Session()
+        
+        # Keep-alive connection pools sized for gateway use (default is 10)
+        adapter = HTTPAdapter(pool_connections=pool_connections,
+                              pool_maxsize=pool_maxsize, pool_block=False)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "Connection": "keep-alive",
+            "Accept-Encoding": "gzip, deflate"
+        })
+    
+    def close(self):
+        """Close pooled connections"""
+        self.session.close()
     
     def submit_offer(self, ddi: Dict, catalog: List[Dict], llc: str, 
                     controller: str = "did:example:controller") -> Dict:
@@ -137,6 +160,189 @@ class DKDCClient:
         response.raise_for_status()
         return response.json()
 
+class DKDCAsyncClient:
+    """Async client for DKDC API (requires httpx)"""
+    
+    def __init__(self, base_url: str = "http://localhost:8080", http2: bool = False,
+                 max_keepalive_connections: int = 64):
+        if not HTTPX_AVAILABLE:
+            raise ImportError("httpx is required for DKDCAsyncClient: pip install httpx")
+        
+        # http2=True additionally requires the h2 package (pip install httpx[http2])
+        self.client = httpx.AsyncClient(
+            base_url=base_url.rstrip("/"),
+            http2=http2,
+            limits=httpx.Limits(max_keepalive_connections=max_keepalive_connections)
+        )
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.close()
+    
+    async def close(self):
+        """Close pooled connections"""
+        await self.client.aclose()
+    
+    async def _post(self, path: str, payload: Dict) -> Dict:
+        response = await self.client.post(path, json=payload)
+        response.raise_for_status()
+        return response.json()
+    
+    async def _get(self, path: str) -> Dict:
+        response = await self.client.get(path)
+        response.raise_for_status()
+        return response.json()
+    
+    async def submit_offer(self, ddi: Dict, catalog: List[Dict], llc: str,
+                           controller: str = "did:example:controller") -> Dict:
+        """Submit context offer"""
+        return await self._post("/dkdc/offer", {
+            "ddi": ddi,
+            "catalog": catalog,
+            "llc": llc,
+            "controller": controller
+        })
+    
+    async def finalize_consense(self, offer_id: str, approvals: List[Dict],
+                                policy: Dict) -> Dict:
+        """Finalize consense with approvals"""
+        return await self._post("/dkdc/consense", {
+            "offer_id": offer_id,
+            "approvals": approvals,
+            "policy": policy
+        })
+    
+    async def issue_token(self, policy_id: str, controller: str, processors: List[str],
+                          purpose: str = "", scopes: List[str] = None, llc: str = "session") -> Dict:
+        """Issue CCT token"""
+        return await self._post("/dkdc/token", {
+            "policy_id": policy_id,
+            "controller": controller,
+            "processors": processors,
+            "purpose": purpose,
+            "scopes": scopes or [],
+            "llc": llc
+        })
+    
+    async def create_parcel(self, cct_token: str, recipient: str,
+                            context_paths: List[str]) -> Dict:
+        """Create context parcel"""
+        return await self._post("/dkdc/context-parcel", {
+            "cct_token": cct_token,
+            "recipient": recipient,
+            "context_paths": context_paths
+        })
+    
+    async def get_audit_trail(self, det_id: str) -> Dict:
+        """Get audit trail"""
+        return await self._get(f"/dkdc/audit/{det_id}")
+    
+    async def revoke_token(self, token_id: str, reason: str) -> Dict:
+        """Revoke token"""
+        return await self._post("/dkdc/revoke", {
+            "token_id": token_id,
+            "reason": reason
+        })
+    
+    async def get_revocation_list(self) -> Dict:
+        """Get revocation list"""
+        return await self._get("/dkdc/crl")
+    
+    async def health_check(self) -> Dict:
+        """Check API health"""
+        return await self._get("/health")
+
+async def example_async_api_flow():
+    """API flow with independent calls issued concurrently"""
+    print("=== DKDC Async API Client Example ===\n")
+    
+    if not HTTPX_AVAILABLE:
+        print("Error: the async example requires httpx (pip install httpx)")
+        return
+    
+    try:
+        async with DKDCAsyncClient() as client:
+            # Health check and offer submission do not depend on each other
+            print("1. Checking API health and submitting context offer...")
+            health, offer_response = await asyncio.gather(
+                client.health_check(),
+                client.submit_offer(
+                    ddi={
+                        "project": "utcs:proj:AMEDEO/BWB-Q100",
+                        "statement": "Co-author BWB-Q100 READMEs and CI rules",
+                        "outputs": ["prs:readme-normalizer"]
+                    },
+                    catalog=[
+                        {"path": "0-STRATEGY/GOVERNANCE.md", "hash": "sha256-abc123"},
+                        {"path": "2-DOMAINS-LEVELS/**/README.md"}
+                    ],
+                    llc="project",
+                    controller="did:example:amedeo"
+                )
+            )
+            print(f"   API Status: {health['status']}")
+            print(f"   Offer ID: {offer_response['offer_id']}")
+            
+            # Consense -> token -> parcel is a dependency chain
+            print("\n2. Finalizing consense...")
+            consense_response = await client.finalize_consense(
+                offer_id=offer_response['offer_id'],
+                approvals=[{
+                    "role": "controller",
+                    "signer": "did:example:amedeo",
+                    "timestamp": "2024-01-15T10:00:00Z",
+                    "signature": "mock_controller_sig"
+                }],
+                policy=offer_response['draft_policy']
+            )
+            policy_id = consense_response.get('policy_id', 'mock:policy')
+            print(f"   Policy ID: {policy_id}")
+            
+            print("\n3. Issuing CCT token...")
+            token_response = await client.issue_token(
+                policy_id=policy_id,
+                controller="did:example:amedeo",
+                processors=["did:example:llm.gateway"],
+                purpose="coauthor:bwb-q100",
+                scopes=["read:repo:0-STRATEGY/GOVERNANCE.md"],
+                llc="project"
+            )
+            print(f"   Token ID: {token_response['token_id']}")
+            
+            print("\n4. Creating context parcel...")
+            parcel_response = await client.create_parcel(
+                cct_token=token_response['cct_token'],
+                recipient="did:example:llm.gateway",
+                context_paths=["0-STRATEGY/GOVERNANCE.md"]
+            )
+            print(f"   DET ID: {parcel_response['det_id']}")
+            
+            # Audit lookup and revocation are independent of each other
+            print("\n5. Retrieving audit trail and revoking token...")
+            audit_response, revoke_response = await asyncio.gather(
+                client.get_audit_trail(parcel_response['det_id']),
+                client.revoke_token(
+                    token_id=token_response['token_id'],
+                    reason="example_complete"
+                )
+            )
+            print(f"   Integrity: {audit_response['verification']['integrity_valid']}")
+            print(f"   Revoked: {revoke_response['revoked']}")
+            
+            print("\n6. Checking revocation list...")
+            crl_response = await client.get_revocation_list()
+            print(f"   Revoked tokens: {len(crl_response['revoked_tokens'])}")
+            
+            print("\n=== Async API Flow Complete ===")
+    
+    except httpx.ConnectError:
+        print("Error: Cannot connect to DKDC API server")
+        print("Start the server with: python api/server.py")
+    except Exception as e:
+        print(f"Error: {e}")
+
 def example_api_flow():
     """Complete API flow example"""
     print("=== DKDC API Client Example ===\n")
@@ -249,4 +455,12 @@ def example_api_flow():
         print(f"Error: {e}")
 
 if __name__ == "__main__":
-    example_api_flow()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="DKDC API client example")
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                        help="Run the concurrent httpx flow instead of the sync flow")
+    args = parser.parse_args()
+    
+    if args.use_async:
+        asyncio.run(example_async_api_flow())
+    else:
+        example_api_flow()
\ No newline at end of file
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Tests for DKDC Policy Batch Prefilter
+"""
+
+import unittest
+import time
+import sys
+from pathlib import Path
+
+# Add DKDC modules to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+try:
+    from engine.policy_batch import evaluate_batch, evaluate_many, pack_contexts
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+def make_context(jti, exp_offset=3600, req_llc="session", auth_llc="project"):
+    """Build a minimal policy input for batch packing"""
+    now = int(time.time())
+    return {
+        "request": {"llc": req_llc},
+        "cct": {"exp": now + exp_offset, "jti": jti, "dkdc": {"llc": auth_llc}},
+        "now": now
+    }
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy not available")
+class TestPolicyBatch(unittest.TestCase):
+    """Test numeric batch prefilter"""
+    
+    def test_evaluate_batch(self):
+        """Test expiry, LLC and revocation rows are flagged"""
+        ctxs = pack_contexts([
+            make_context("ok"),
+            make_context("expired", exp_offset=-1),
+            make_context("too-broad", req_llc="portfolio"),
+            make_context("invalid", req_llc="forever"),
+            make_context("revoked"),
+            make_context("no-llc", req_llc=""),
+        ])
+        
+        mask = evaluate_batch(ctxs, revoked_tokens={"revoked"})
+        self.assertEqual(mask.tolist(), [False, True, True, True, True, False])
+    
+    def test_evaluate_batch_without_revocations(self):
+        """Test an empty revocation list flags nothing on its own"""
+        mask = evaluate_batch(pack_contexts([make_context("a"), make_context("b")]))
+        self.assertEqual(mask.tolist(), [False, False])
+    
+    def test_evaluate_many_matches_kernel(self):
+        """Test the vectorized NumPy path agrees with the batch kernel"""
+        ctxs = pack_contexts([
+            make_context("ok"),
+            make_context("expired", exp_offset=-1),
+            make_context("too-broad", req_llc="portfolio"),
+            make_context("unset-auth", req_llc="portfolio", auth_llc=""),
+            make_context("revoked"),
+        ])
+        
+        mask = evaluate_many(ctxs["exp"], ctxs["now"], ctxs["req_llc"],
+                             ctxs["auth_llc"], ctxs["jti_hash"], revoked_tokens={"revoked"})
+        self.assertEqual(mask.tolist(), [False, True, True, False, True])
+        self.assertEqual(mask.tolist(), evaluate_batch(ctxs, revoked_tokens={"revoked"}).tolist())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Tests for DKDC Policy Guard
+"""
+
+import unittest
+import time
+import sys
+from pathlib import Path
+
+# Add DKDC modules to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from engine.policy_guard import PolicyGuard, PolicyViolation
+
+def make_input(**request_overrides):
+    """Build a valid policy input for a project-level token"""
+    now = int(time.time())
+    request = {
+        "scopes": ["read:repo:0-STRATEGY/GOVERNANCE.md"],
+        "action": "read:content"
+    }
+    request.update(request_overrides)
+    return {
+        "request": request,
+        "cct": {
+            "exp": now + 3600,
+            "jti": "test-token-123",
+            "dkdc": {
+                "scopes": ["read:repo:0-STRATEGY/GOVERNANCE.md", "write:suggestions:*"],
+                "export": {"internet": False, "model_to_model": True, "third_party": False},
+                "llc": "project"
+            }
+        },
+        "now": now,
+        "revoked_tokens": set()
+    }
+
+class TestPolicyGuard(unittest.TestCase):
+    """Test policy guard functionality"""
+    
+    def setUp(self):
+        self.guard = PolicyGuard()
+    
+    def test_valid_request(self):
+        """Test valid request has no violations"""
+        self.assertEqual(self.guard.evaluate(make_input()), [])
+    
+    def test_unauthorized_scope(self):
+        """Test unauthorized scope is rejected"""
+        violations = self.guard.evaluate(make_input(scopes=["read:repo:secret-config.yaml"]))
+        self.assertEqual([v.rule for v in violations], ["scope_authorization"])
+    
+    def test_wildcard_scope(self):
+        """Test wildcard scopes authorize matching requests"""
+        violations = self.guard.evaluate(make_input(scopes="write:suggestions:pull-requests"))
+        self.assertEqual(violations, [])
+    
+    def test_llc_exceeds_authorization(self):
+        """Test requesting a broader LLC than authorized is rejected"""
+        violations = self.guard.evaluate(make_input(llc="portfolio"))
+        self.assertEqual([v.rule for v in violations], ["llc_compliance"])
+        self.assertEqual(self.guard.evaluate(make_input(llc="session")), [])
+    
+    def test_invalid_llc(self):
+        """Test unknown LLC values are reported"""
+        violations = self.guard.evaluate(make_input(llc="forever"))
+        self.assertEqual(violations[0].message, "Invalid LLC value: forever")
+    
+    def test_malformed_input(self):
+        """Test non-mapping input sections are rejected up front"""
+        input_data = make_input()
+        input_data["cct"]["dkdc"] = ["not", "a", "mapping"]
+        
+        violations = self.guard.evaluate(input_data)
+        self.assertEqual([v.rule for v in violations], ["input_validation"])
+        
+        violations = self.guard.evaluate(make_input(scopes={"read:repo:*": True}))
+        self.assertEqual([v.rule for v in violations], ["input_validation"])
+    
+    def test_rules_ordered_by_cost(self):
+        """Test cheap rules are evaluated before expensive ones"""
+        costs = [cost for _name, _rule, cost in self.guard.rules]
+        self.assertEqual(costs, sorted(costs))
+        self.assertEqual(self.guard.rules[0][0], "token_expiry")
+        self.assertEqual(self.guard.rules[-1][0], "redaction_enforcement")
+    
+    def test_cached_result_reused(self):
+        """Test repeated evaluations are served from the cache"""
+        input_data = make_input(action="export:internet")
+        first = self.guard.evaluate(input_data)
+        second = self.guard.evaluate(input_data)
+        
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertEqual(len(self.guard._eval_cache), 1)
+    
+    def test_cache_respects_expiry(self):
+        """Test cached approval is not reused once the token expires"""
+        input_data = make_input()
+        self.assertEqual(self.guard.evaluate(input_data), [])
+        
+        input_data["now"] = input_data["cct"]["exp"] + 1
+        violations = self.guard.evaluate(input_data)
+        self.assertIn("token_expiry", [v.rule for v in violations])
+    
+    def test_cache_respects_revocation(self):
+        """Test revoking a token invalidates its cached results"""
+        input_data = make_input()
+        self.assertEqual(self.guard.evaluate(input_data), [])
+        
+        input_data["revoked_tokens"] = {"test-token-123"}
+        violations = self.guard.evaluate(input_data)
+        self.assertEqual([v.rule for v in violations], ["revocation_status"])
+        self.assertEqual(len(self.guard._eval_cache), 0)
+    
+    def test_non_numeric_expiry_fails_closed(self):
+        """Test a malformed exp is reported as a violation, cached or not"""
+        for guard in (self.guard, PolicyGuard(cache_maxsize=0)):
+            input_data = make_input()
+            input_data["cct"]["exp"] = "soon"
+            violations = guard.evaluate(input_data)
+            self.assertEqual([v.rule for v in violations], ["token_expiry"])
+            self.assertTrue(violations[0].message.startswith("Rule evaluation error"))
+        self.assertEqual(len(self.guard._eval_cache), 0)
+    
+    def test_unsortable_request_keys_not_cached(self):
+        """Test a request whose keys cannot be fingerprinted is still evaluated"""
+        input_data = make_input()
+        input_data["request"][1] = "a"
+        self.assertEqual(self.guard.evaluate(input_data), [])
+        self.assertEqual(len(self.guard._eval_cache), 0)
+    
+    def test_unhashable_jti_fails_closed(self):
+        """Test a list jti is reported as a violation instead of raising"""
+        input_data = make_input()
+        input_data["cct"]["jti"] = ["test-token-123"]
+        violations = self.guard.evaluate(input_data)
+        self.assertEqual([v.rule for v in violations], ["revocation_status"])
+        self.assertTrue(violations[0].message.startswith("Rule evaluation error"))
+        self.assertEqual(len(self.guard._eval_cache), 0)
+    
+    def test_missing_revocation_list_fails_closed(self):
+        """Test revoked_tokens=None is reported as a violation instead of raising"""
+        input_data = make_input()
+        input_data["revoked_tokens"] = None
+        violations = self.guard.evaluate(input_data)
+        self.assertEqual([v.rule for v in violations], ["revocation_status"])
+        self.assertTrue(violations[0].message.startswith("Rule evaluation error"))
+        self.assertEqual(len(self.guard._eval_cache), 0)
+    
+    def test_reused_jti_with_other_claims_not_served_from_cache(self):
+        """Test a token reusing a jti with narrower scopes is evaluated afresh"""
+        self.assertEqual(self.guard.evaluate(make_input()), [])
+    
+        input_data = make_input()
+        input_data["cct"]["dkdc"]["scopes"] = ["write:suggestions:*"]
+        violations = self.guard.evaluate(input_data)
+        self.assertEqual([v.rule for v in violations], ["scope_authorization"])
+    
+    def test_redaction_scan_reused_for_repeated_content(self):
+        """Test repeated content reuses the redaction scan result"""
+        for action in ("read:content", "write:suggestions"):
+            input_data = make_input(action=action, content="password: hunter2")
+            input_data["cct"]["dkdc"]["redaction_vectors"] = ["/secrets"]
+            violations = self.guard.evaluate(input_data)
+            self.assertEqual([v.rule for v in violations], ["redaction_enforcement"])
+        
+        self.assertEqual(len(self.guard._redaction_cache), 1)
+    
+    def test_redaction_reports_matched_vector(self):
+        """Test the combined redaction scan reports the vector that matched"""
+        input_data = make_input(content="use api-key abc123")
+        input_data["cct"]["dkdc"]["redaction_vectors"] = ["/personal", "/credentials"]
+        violations = self.guard.evaluate(input_data)
+        self.assertEqual(len(violations), 1)
+        self.assertTrue(violations[0].message.endswith("/credentials"))
+    
+    def test_violations_are_hashable(self):
+        """Test violations are immutable and can be deduplicated"""
+        violation = PolicyViolation(rule="token_expiry", message="CCT token has expired")
+        self.assertEqual(len({violation, PolicyViolation("token_expiry", "CCT token has expired")}), 1)
+        with self.assertRaises(AttributeError):
+            violation.severity = "warning"
+    
+    def test_specialized_evaluator_matches_rules(self):
+        """Test the per-token evaluator agrees with the generic rule path"""
+        for overrides in ({}, {"llc": "portfolio"}, {"action": "export:internet"},
+                          {"scopes": ["read:repo:secret-config.yaml"]}):
+            args = self.guard._validate_input(make_input(**overrides))
+            evaluator = self.guard._get_specialized("test-token-123", args[1], args[2], args[3])
+            self.assertEqual(evaluator(args[0], args[5]), self.guard._evaluate_rules(args))
+    
+    def test_specialized_evaluator_dropped_on_revocation(self):
+        """Test revoking a token discards its specialized evaluator"""
+        self.guard.evaluate(make_input())
+        self.assertEqual(len(self.guard._specialized_cache), 1)
+        
+        input_data = make_input()
+        input_data["revoked_tokens"] = {"test-token-123"}
+        self.guard.evaluate(input_data)
+        self.assertEqual(len(self.guard._specialized_cache), 0)
+    
+    def test_specialized_evaluator_keyed_by_claims(self):
+        """Test a reused jti with other scopes gets its own evaluator"""
+        args = self.guard._validate_input(make_input())
+        first = self.guard._get_specialized("test-token-123", args[1], args[2], args[3])
+        
+        input_data = make_input()
+        input_data["cct"]["dkdc"]["scopes"] = ["write:suggestions:*"]
+        args = self.guard._validate_input(input_data)
+        second = self.guard._get_specialized("test-token-123", args[1], args[2], args[3])
+        
+        self.assertIsNot(first, second)
+        self.assertEqual([v.rule for v in second(args[0], args[5])], ["scope_authorization"])
+        self.assertEqual(len(self.guard._specialized_cache), 2)
+    
+    def test_specialized_evaluator_checks_live_expiry(self):
+        """Test a cached evaluator is not used for an expired token"""
+        self.assertEqual(self.guard.evaluate(make_input()), [])
+        
+        input_data = make_input(action="export:internet")
+        input_data["cct"]["exp"] = input_data["now"] - 3600
+        violations = self.guard.evaluate(input_data)
+        self.assertEqual([v.rule for v in violations], ["token_expiry", "export_controls"])
+
+if __name__ == "__main__":
+    unittest.main()
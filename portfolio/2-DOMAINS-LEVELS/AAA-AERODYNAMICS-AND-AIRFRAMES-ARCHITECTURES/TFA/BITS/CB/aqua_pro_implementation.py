@@ -9,133 +9,12 @@ This module implements the CB layer functionality for the AAA domain
 within the AQUA OS Predictive Route Optimizer system.
 """
 
-import logging
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
-from abc import ABC, abstractmethod
+from aqua_pro_base import make_aqua_pro_layer, run_example
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-@dataclass
-class AquaProConfig:
-    """Configuration for AQUA OS PRO CB layer"""
-    domain: str = "AAA"
-    layer: str = "CB"
-    version: str = "v1.0.0"
-    enabled: bool = True
-    # No additional config fields
-
-class AquaProCBInterface(ABC):
-    """Abstract interface for CB layer implementation"""
-    
-    @abstractmethod
-    def initialize(self, config: AquaProConfig) -> bool:
-        """Initialize the CB layer"""
-        pass
-    
-    @abstractmethod
-    def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Process data through the CB layer"""
-        pass
-    
-    @abstractmethod
-    def get_status(self) -> Dict[str, Any]:
-        """Get current status of the CB layer"""
-        pass
-
-class AquaProCBImplementation(AquaProCBInterface):
-    """Concrete implementation of CB layer for AAA domain"""
-    
-    def __init__(self, config: AquaProConfig):
-        self.config = config
-        self.initialized = False
-        logger.info(f"Initializing AQUA PRO CB for AAA")
-        
-    def initialize(self, config: AquaProConfig) -> bool:
-        """Initialize the CB layer"""
-        try:
-            # TODO: Implement initialization logic
-            # Initialize CB layer components
-            
-            self.initialized = True
-            logger.info(f"CB layer initialized successfully")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to initialize CB layer: {e}")
-            return False
-    
-    def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Process data through the CB layer"""
-        if not self.initialized:
-            raise RuntimeError(f"CB layer not initialized")
-        
-        try:
-            # TODO: Implement processing logic
-            
-            # Execute classical algorithms
-            # Apply deterministic processing
-            # Return optimized results
-            
-            result = {
-                "status": "success",
-                "layer": self.config.layer,
-                "domain": self.config.domain,
-                "processed_at": "{import time; time.time()}",
-                "output": {"data": "processed"}
-            }
-            
-            return result
-            
-        except Exception as e:
-            logger.error(f"Error processing in CB layer: {e}")
-            raise
-    
-    def get_status(self) -> Dict[str, Any]:
-        """Get current status of the CB layer"""
-        return {
-            "layer": self.config.layer,
-            "domain": self.config.domain,
-            "initialized": self.initialized,
-            "version": self.config.version,
-            "enabled": self.config.enabled
-        }
-
-# Factory function for creating CB layer instances
-def create_aqua_pro_cb(config: Optional[AquaProConfig] = None) -> AquaProCBImplementation:
-    """Factory function to create CB layer instance"""
-    if config is None:
-        config = AquaProConfig()
-    
-    return AquaProCBImplementation(config)
-
-# Module-level interface for easy access
-def initialize_cb(config: Optional[Dict[str, Any]] = None) -> AquaProCBImplementation:
-    """Initialize CB layer with optional configuration"""
-    if config:
-        aqua_config = AquaProConfig(**config)
-    else:
-        aqua_config = AquaProConfig()
-    
-    implementation = create_aqua_pro_cb(aqua_config)
-    implementation.initialize(aqua_config)
-    
-    return implementation
+AquaProConfig, AquaProCBImplementation, create_aqua_pro_cb, initialize_cb = make_aqua_pro_layer("AAA", "CB", logger_name=__name__)
 
 if __name__ == "__main__":
-    # Example usage
-    print("AQUA OS PRO CB Layer - AAA Domain")
-    
-    # Initialize with default configuration
-    cb_impl = initialize_cb()
-    
-    # Check status
-    status = cb_impl.get_status()
-    print(f"Status: {status}")
-    
-    # Process sample data
-    sample_input = {"test": "data", "domain": "AAA", "layer": "CB"}
-    result = cb_impl.process(sample_input)
-    print(f"Result: {result}")
+    import logging
+    logging.basicConfig(level=logging.INFO)
+
+    run_example(initialize_cb())
@@ -9,134 +9,15 @@ This module implements the FWD layer functionality for the AAP domain
 within the AQUA OS Predictive Route Optimizer system.
 """
 
-import logging
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
-from abc import ABC, abstractmethod
+from aqua_pro_base import make_aqua_pro_layer, run_example
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-@dataclass
-class AquaProConfig:
-    """Configuration for AQUA OS PRO FWD layer"""
-    domain: str = "AAP"
-    layer: str = "FWD"
-    version: str = "v1.0.0"
-    enabled: bool = True
-    prediction_horizon: int = 20  # minutes
-    update_frequency: int = 30  # seconds
-
-class AquaProFWDInterface(ABC):
-    """Abstract interface for FWD layer implementation"""
-    
-    @abstractmethod
-    def initialize(self, config: AquaProConfig) -> bool:
-        """Initialize the FWD layer"""
-        pass
-    
-    @abstractmethod
-    def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Process data through the FWD layer"""
-        pass
-    
-    @abstractmethod
-    def get_status(self) -> Dict[str, Any]:
-        """Get current status of the FWD layer"""
-        pass
-
-class AquaProFWDImplementation(AquaProFWDInterface):
-    """Concrete implementation of FWD layer for AAP domain"""
-    
-    def __init__(self, config: AquaProConfig):
-        self.config = config
-        self.initialized = False
-        logger.info(f"Initializing AQUA PRO FWD for AAP")
-        
-    def initialize(self, config: AquaProConfig) -> bool:
-        """Initialize the FWD layer"""
-        try:
-            # TODO: Implement initialization logic
-            # Initialize FWD layer components
-            
-            self.initialized = True
-            logger.info(f"FWD layer initialized successfully")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to initialize FWD layer: {e}")
-            return False
-    
-    def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Process data through the FWD layer"""
-        if not self.initialized:
-            raise RuntimeError(f"FWD layer not initialized")
-        
-        try:
-            # TODO: Implement processing logic
-            
-            # Generate predictions
-            # Apply nowcast models
-            # Return forecast data
-            
-            result = {
-                "status": "success",
-                "layer": self.config.layer,
-                "domain": self.config.domain,
-                "processed_at": "{import time; time.time()}",
-                "output": {"data": "processed"}
-            }
-            
-            return result
-            
-        except Exception as e:
-            logger.error(f"Error processing in FWD layer: {e}")
-            raise
-    
-    def get_status(self) -> Dict[str, Any]:
-        """Get current status of the FWD layer"""
-        return {
-            "layer": self.config.layer,
-            "domain": self.config.domain,
-            "initialized": self.initialized,
-            "version": self.config.version,
-            "enabled": self.config.enabled
-        }
-
-# Factory function for creating FWD layer instances
-def create_aqua_pro_fwd(config: Optional[AquaProConfig] = None) -> AquaProFWDImplementation:
-    """Factory function to create FWD layer instance"""
-    if config is None:
-        config = AquaProConfig()
-    
-    return AquaProFWDImplementation(config)
-
-# Module-level interface for easy access
-def initialize_fwd(config: Optional[Dict[str, Any]] = None) -> AquaProFWDImplementation:
-    """Initialize FWD layer with optional configuration"""
-    if config:
-        aqua_config = AquaProConfig(**config)
-    else:
-        aqua_config = AquaProConfig()
-    
-    implementation = create_aqua_pro_fwd(aqua_config)
-    implementation.initialize(aqua_config)
-    
-    return implementation
+AquaProConfig, AquaProFWDImplementation, create_aqua_pro_fwd, initialize_fwd = make_aqua_pro_layer("AAP", "FWD", extra_fields=[
+    ("prediction_horizon", int, 20),  # minutes
+    ("update_frequency", int, 30),  # seconds
+], logger_name=__name__)
 
 if __name__ == "__main__":
-    # Example usage
-    print("AQUA OS PRO FWD Layer - AAP Domain")
-    
-    # Initialize with default configuration
-    fwd_impl = initialize_fwd()
-    
-    # Check status
-    status = fwd_impl.get_status()
-    print(f"Status: {status}")
-    
-    # Process sample data
-    sample_input = {"test": "data", "domain": "AAP", "layer": "FWD"}
-    result = fwd_impl.process(sample_input)
-    print(f"Result: {result}")
+    import logging
+    logging.basicConfig(level=logging.INFO)
+
+    run_example(initialize_fwd())
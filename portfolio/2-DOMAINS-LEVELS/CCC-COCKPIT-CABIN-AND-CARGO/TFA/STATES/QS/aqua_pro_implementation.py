@@ -9,130 +9,12 @@ This module implements the QS layer functionality for the CCC domain
 within the AQUA OS Predictive Route Optimizer system.
 """
 
-import logging
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
-from abc import ABC, abstractmethod
+from aqua_pro_base import make_aqua_pro_layer, run_example
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-@dataclass
-class AquaProConfig:
-    """Configuration for AQUA OS PRO QS layer"""
-    domain: str = "CCC"
-    layer: str = "QS"
-    version: str = "v1.0.0"
-    enabled: bool = True
-    # No additional config fields
-
-class AquaProQSInterface(ABC):
-    """Abstract interface for QS layer implementation"""
-    
-    @abstractmethod
-    def initialize(self, config: AquaProConfig) -> bool:
-        """Initialize the QS layer"""
-        pass
-    
-    @abstractmethod
-    def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Process data through the QS layer"""
-        pass
-    
-    @abstractmethod
-    def get_status(self) -> Dict[str, Any]:
-        """Get current status of the QS layer"""
-        pass
-
-class AquaProQSImplementation(AquaProQSInterface):
-    """Concrete implementation of QS layer for CCC domain"""
-    
-    def __init__(self, config: AquaProConfig):
-        self.config = config
-        self.initialized = False
-        logger.info(f"Initializing AQUA PRO QS for CCC")
-        
-    def initialize(self, config: AquaProConfig) -> bool:
-        """Initialize the QS layer"""
-        try:
-            # TODO: Implement initialization logic
-            # Initialize QS layer components
-            
-            self.initialized = True
-            logger.info(f"QS layer initialized successfully")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to initialize QS layer: {e}")
-            return False
-    
-    def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Process data through the QS layer"""
-        if not self.initialized:
-            raise RuntimeError(f"QS layer not initialized")
-        
-        try:
-            # TODO: Implement processing logic
-            # Process data through QS layer
-            
-            result = {
-                "status": "success",
-                "layer": self.config.layer,
-                "domain": self.config.domain,
-                "processed_at": "{import time; time.time()}",
-                "output": {"data": "processed"}
-            }
-            
-            return result
-            
-        except Exception as e:
-            logger.error(f"Error processing in QS layer: {e}")
-            raise
-    
-    def get_status(self) -> Dict[str, Any]:
-        """Get current status of the QS layer"""
-        return {
-            "layer": self.config.layer,
-            "domain": self.config.domain,
-            "initialized": self.initialized,
-            "version": self.config.version,
-            "enabled": self.config.enabled
-        }
-
-# Factory function for creating QS layer instances
-def create_aqua_pro_qs(config: Optional[AquaProConfig] = None) -> AquaProQSImplementation:
-    """Factory function to create QS layer instance"""
-    if config is None:
-        config = AquaProConfig()
-    
-    return AquaProQSImplementation(config)
-
-# Module-level interface for easy access
-def initialize_qs(config: Optional[Dict[str, Any]] = None) -> AquaProQSImplementation:
-    """Initialize QS layer with optional configuration"""
-    if config:
-        aqua_config = AquaProConfig(**config)
-    else:
-        aqua_config = AquaProConfig()
-    
-    implementation = create_aqua_pro_qs(aqua_config)
-    implementation.initialize(aqua_config)
-    
-    return implementation
+AquaProConfig, AquaProQSImplementation, create_aqua_pro_qs, initialize_qs = make_aqua_pro_layer("CCC", "QS", logger_name=__name__)
 
 if __name__ == "__main__":
-    # Example usage
-    print("AQUA OS PRO QS Layer - CCC Domain")
-    
-    # Initialize with default configuration
-    qs_impl = initialize_qs()
-    
-    # Check status
-    status = qs_impl.get_status()
-    print(f"Status: {status}")
-    
-    # Process sample data
-    sample_input = {"test": "data", "domain": "CCC", "layer": "QS"}
-    result = qs_impl.process(sample_input)
-    print(f"Result: {result}")
+    import logging
+    logging.basicConfig(level=logging.INFO)
+
+    run_example(initialize_qs())
@@ -9,130 +9,12 @@ This module implements the SE layer functionality for the CCC domain
 within the AQUA OS Predictive Route Optimizer system.
 """
 
-import logging
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
-from abc import ABC, abstractmethod
+from aqua_pro_base import make_aqua_pro_layer, run_example
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-@dataclass
-class AquaProConfig:
-    """Configuration for AQUA OS PRO SE layer"""
-    domain: str = "CCC"
-    layer: str = "SE"
-    version: str = "v1.0.0"
-    enabled: bool = True
-    # No additional config fields
-
-class AquaProSEInterface(ABC):
-    """Abstract interface for SE layer implementation"""
-    
-    @abstractmethod
-    def initialize(self, config: AquaProConfig) -> bool:
-        """Initialize the SE layer"""
-        pass
-    
-    @abstractmethod
-    def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Process data through the SE layer"""
-        pass
-    
-    @abstractmethod
-    def get_status(self) -> Dict[str, Any]:
-        """Get current status of the SE layer"""
-        pass
-
-class AquaProSEImplementation(AquaProSEInterface):
-    """Concrete implementation of SE layer for CCC domain"""
-    
-    def __init__(self, config: AquaProConfig):
-        self.config = config
-        self.initialized = False
-        logger.info(f"Initializing AQUA PRO SE for CCC")
-        
-    def initialize(self, config: AquaProConfig) -> bool:
-        """Initialize the SE layer"""
-        try:
-            # TODO: Implement initialization logic
-            # Initialize SE layer components
-            
-            self.initialized = True
-            logger.info(f"SE layer initialized successfully")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to initialize SE layer: {e}")
-            return False
-    
-    def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Process data through the SE layer"""
-        if not self.initialized:
-            raise RuntimeError(f"SE layer not initialized")
-        
-        try:
-            # TODO: Implement processing logic
-            # Process data through SE layer
-            
-            result = {
-                "status": "success",
-                "layer": self.config.layer,
-                "domain": self.config.domain,
-                "processed_at": "{import time; time.time()}",
-                "output": {"data": "processed"}
-            }
-            
-            return result
-            
-        except Exception as e:
-            logger.error(f"Error processing in SE layer: {e}")
-            raise
-    
-    def get_status(self) -> Dict[str, Any]:
-        """Get current status of the SE layer"""
-        return {
-            "layer": self.config.layer,
-            "domain": self.config.domain,
-            "initialized": self.initialized,
-            "version": self.config.version,
-            "enabled": self.config.enabled
-        }
-
-# Factory function for creating SE layer instances
-def create_aqua_pro_se(config: Optional[AquaProConfig] = None) -> AquaProSEImplementation:
-    """Factory function to create SE layer instance"""
-    if config is None:
-        config = AquaProConfig()
-    
-    return AquaProSEImplementation(config)
-
-# Module-level interface for easy access
-def initialize_se(config: Optional[Dict[str, Any]] = None) -> AquaProSEImplementation:
-    """Initialize SE layer with optional configuration"""
-    if config:
-        aqua_config = AquaProConfig(**config)
-    else:
-        aqua_config = AquaProConfig()
-    
-    implementation = create_aqua_pro_se(aqua_config)
-    implementation.initialize(aqua_config)
-    
-    return implementation
+AquaProConfig, AquaProSEImplementation, create_aqua_pro_se, initialize_se = make_aqua_pro_layer("CCC", "SE", logger_name=__name__)
 
 if __name__ == "__main__":
-    # Example usage
-    print("AQUA OS PRO SE Layer - CCC Domain")
-    
-    # Initialize with default configuration
-    se_impl = initialize_se()
-    
-    # Check status
-    status = se_impl.get_status()
-    print(f"Status: {status}")
-    
-    # Process sample data
-    sample_input = {"test": "data", "domain": "CCC", "layer": "SE"}
-    result = se_impl.process(sample_input)
-    print(f"Result: {result}")
+    import logging
+    logging.basicConfig(level=logging.INFO)
+
+    run_example(initialize_se())
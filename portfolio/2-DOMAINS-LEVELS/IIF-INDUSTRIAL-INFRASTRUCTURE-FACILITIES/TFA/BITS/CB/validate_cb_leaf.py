@@ -4,56 +4,131 @@ CB Leaf Validator for Industrial Infrastructure Facilities Domain
 Validates Classical Bit configurations and ensures TFA compliance.
 """
 
+import concurrent.futures
 import json
 import os
 import sys
 from pathlib import Path
+from typing import Annotated, Any, List, Tuple
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-def validate_cb_leaf(leaf_dir: Path) -> bool:
-    """Validate CB leaf directory structure and content."""
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+REQUIRED_FILES = ("meta.yaml", "cb-config.json", "validate_cb_leaf.py")
+REQUIRED_FIELDS = ("cb_id", "description", "version", "algorithms")
+# Should match: {program}-{baseline}-{domain}-{layer}-{code}-{mapChapter}
+CB_ID_PREFIX = "ampel360bwbq-0001-IIF-CB-"
+
+if MSGSPEC_AVAILABLE:
+    class CBConfig(msgspec.Struct):
+        """Typed view of cb-config.json; extra keys are ignored."""
+        cb_id: Annotated[str, msgspec.Meta(pattern=f"^{CB_ID_PREFIX}")]
+        description: Any
+        version: Any
+        algorithms: Any
+
+    _cb_config_decoder = msgspec.json.Decoder(CBConfig)
+else:
+    _cb_config_decoder = None
+
+
+def load_config(raw: bytes):
+    """Parse cb-config.json bytes, with orjson when available."""
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+
+def config_decodes(raw: bytes) -> bool:
+    """Parse and validate raw config bytes in one msgspec pass."""
+    try:
+        _cb_config_decoder.decode(raw)
+        return True
+    except (msgspec.ValidationError, msgspec.DecodeError):
+        return False
+
+
+def config_errors(config) -> list:
+    """Return the detailed cb-config.json field errors."""
+    errors = []
+    
+    # Check required config fields
+    for field in REQUIRED_FIELDS:
+        if field not in config:
+            errors.append(f"Missing required field in cb-config.json: {field}")
+            
+    # Validate CB ID format
+    if "cb_id" in config:
+        cb_id = config["cb_id"]
+        if not cb_id.startswith(CB_ID_PREFIX):
+            errors.append(f"CB ID format invalid: {cb_id}")
+    
+    return errors
+
+
+def check_cb_leaf(leaf_dir: Path) -> Tuple[bool, str]:
+    """Validate a CB leaf and return the result with its report lines."""
     errors = []
     
-    # Check required files exist
-    required_files = ["meta.yaml", "cb-config.json", "validate_cb_leaf.py"]
-    for file_name in required_files:
-        file_path = leaf_dir / file_name
-        if not file_path.exists():
+    # Check required files exist (one directory read instead of a stat per file)
+    try:
+        with os.scandir(leaf_dir) as entries:
+            present = {entry.name for entry in entries}
+    except OSError:
+        present = set()
+    
+    for file_name in REQUIRED_FILES:
+        if file_name not in present:
             errors.append(f"Missing required file: {file_name}")
     
     # Validate cb-config.json
     config_path = leaf_dir / "cb-config.json"
-    if config_path.exists():
+    if "cb-config.json" in present:
         try:
-            with open(config_path) as f:
-                config = json.load(f)
+            raw = config_path.read_bytes()
             
-            # Check required config fields
-            required_fields = ["cb_id", "description", "version", "algorithms"]
-            for field in required_fields:
-                if field not in config:
-                    errors.append(f"Missing required field in cb-config.json: {field}")
-                    
-            # Validate CB ID format
-            if "cb_id" in config:
-                cb_id = config["cb_id"]
-                # Should match: {program}-{baseline}-{domain}-{layer}-{code}-{mapChapter}
-                if not cb_id.startswith("ampel360bwbq-0001-IIF-CB-"):
-                    errors.append(f"CB ID format invalid: {cb_id}")
+            # Detailed checks only run when the msgspec fast path rejects the config
+            if _cb_config_decoder is None or not config_decodes(raw):
+                errors.extend(config_errors(load_config(raw)))
                     
         except json.JSONDecodeError as e:
             errors.append(f"Invalid JSON in cb-config.json: {e}")
     
     if errors:
-        for error in errors:
-            print(f"::error file={leaf_dir}::{error} (violates 13.4 Required Leaf Files)")
-        return False
+        return False, "".join(
+            f"::error file={leaf_dir}::{error} (violates 13.4 Required Leaf Files)\n"
+            for error in errors
+        )
     else:
-        print(f"✓ CB leaf validation passed: {leaf_dir}")
-        return True
+        return True, f"✓ CB leaf validation passed: {leaf_dir}\n"
+
+
+def validate_cb_leaf(leaf_dir: Path) -> bool:
+    """Validate CB leaf directory structure and content."""
+    success, report = check_cb_leaf(leaf_dir)
+    # One write per leaf; workflow commands (::error) are read from stdout
+    sys.stdout.write(report)
+    return success
+
+
+def validate_many(leaf_dirs: List[Path]) -> bool:
+    """Validate several CB leaf directories across worker processes."""
+    with concurrent.futures.ProcessPoolExecutor() as executor:
+        results = list(executor.map(check_cb_leaf, leaf_dirs, chunksize=16))
+    sys.stdout.write("".join(report for _success, report in results))
+    return all(success for success, _report in results)
 
 
 if __name__ == "__main__":
-    leaf_dir = Path(__file__).parent
-    success = validate_cb_leaf(leaf_dir)
+    if len(sys.argv) > 1:
+        success = validate_many([Path(p) for p in sys.argv[1:]])
+    else:
+        success = validate_cb_leaf(Path(__file__).parent)
     sys.exit(0 if success else 1)
\ No newline at end of file
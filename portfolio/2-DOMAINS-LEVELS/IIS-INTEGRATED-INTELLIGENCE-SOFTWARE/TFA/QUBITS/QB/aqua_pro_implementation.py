@@ -9,138 +9,16 @@ This module implements the QB layer functionality for the IIS domain
 within the AQUA OS Predictive Route Optimizer system.
 """
 
-import logging
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
-from abc import ABC, abstractmethod
+from aqua_pro_base import make_aqua_pro_layer, run_example
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-@dataclass
-class AquaProConfig:
-    """Configuration for AQUA OS PRO QB layer"""
-    domain: str = "IIS"
-    layer: str = "QB"
-    version: str = "v1.0.0"
-    enabled: bool = True
-    quantum_backend: str = 'auto'
-    shots: int = 1024
-    fallback_enabled: bool = True
-
-class AquaProQBInterface(ABC):
-    """Abstract interface for QB layer implementation"""
-    
-    @abstractmethod
-    def initialize(self, config: AquaProConfig) -> bool:
-        """Initialize the QB layer"""
-        pass
-    
-    @abstractmethod
-    def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Process data through the QB layer"""
-        pass
-    
-    @abstractmethod
-    def get_status(self) -> Dict[str, Any]:
-        """Get current status of the QB layer"""
-        pass
-
-class AquaProQBImplementation(AquaProQBInterface):
-    """Concrete implementation of QB layer for IIS domain"""
-    
-    def __init__(self, config: AquaProConfig):
-        self.config = config
-        self.initialized = False
-        logger.info(f"Initializing AQUA PRO QB for IIS")
-        
-    def initialize(self, config: AquaProConfig) -> bool:
-        """Initialize the QB layer"""
-        try:
-            # TODO: Implement initialization logic
-            
-            # Initialize quantum backend
-            # Set up QAOA/VQE strategies
-            # Configure classical fallback
-            
-            self.initialized = True
-            logger.info(f"QB layer initialized successfully")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to initialize QB layer: {e}")
-            return False
-    
-    def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Process data through the QB layer"""
-        if not self.initialized:
-            raise RuntimeError(f"QB layer not initialized")
-        
-        try:
-            # TODO: Implement processing logic
-            
-            # Execute quantum optimization
-            # Apply QAOA/VQE strategies  
-            # Fallback to classical if needed
-            
-            result = {
-                "status": "success",
-                "layer": self.config.layer,
-                "domain": self.config.domain,
-                "processed_at": "{import time; time.time()}",
-                "output": {"data": "processed"}
-            }
-            
-            return result
-            
-        except Exception as e:
-            logger.error(f"Error processing in QB layer: {e}")
-            raise
-    
-    def get_status(self) -> Dict[str, Any]:
-        """Get current status of the QB layer"""
-        return {
-            "layer": self.config.layer,
-            "domain": self.config.domain,
-            "initialized": self.initialized,
-            "version": self.config.version,
-            "enabled": self.config.enabled
-        }
-
-# Factory function for creating QB layer instances
-def create_aqua_pro_qb(config: Optional[AquaProConfig] = None) -> AquaProQBImplementation:
-    """Factory function to create QB layer instance"""
-    if config is None:
-        config = AquaProConfig()
-    
-    return AquaProQBImplementation(config)
-
-# Module-level interface for easy access
-def initialize_qb(config: Optional[Dict[str, Any]] = None) -> AquaProQBImplementation:
-    """Initialize QB layer with optional configuration"""
-    if config:
-        aqua_config = AquaProConfig(**config)
-    else:
-        aqua_config = AquaProConfig()
-    
-    implementation = create_aqua_pro_qb(aqua_config)
-    implementation.initialize(aqua_config)
-    
-    return implementation
+AquaProConfig, AquaProQBImplementation, create_aqua_pro_qb, initialize_qb = make_aqua_pro_layer("IIS", "QB", extra_fields=[
+    ("quantum_backend", str, 'auto'),
+    ("shots", int, 1024),
+    ("fallback_enabled", bool, True),
+], logger_name=__name__)
 
 if __name__ == "__main__":
-    # Example usage
-    print("AQUA OS PRO QB Layer - IIS Domain")
-    
-    # Initialize with default configuration
-    qb_impl = initialize_qb()
-    
-    # Check status
-    status = qb_impl.get_status()
-    print(f"Status: {status}")
-    
-    # Process sample data
-    sample_input = {"test": "data", "domain": "IIS", "layer": "QB"}
-    result = qb_impl.process(sample_input)
-    print(f"Result: {result}")
+    import logging
+    logging.basicConfig(level=logging.INFO)
+
+    run_example(initialize_qb())
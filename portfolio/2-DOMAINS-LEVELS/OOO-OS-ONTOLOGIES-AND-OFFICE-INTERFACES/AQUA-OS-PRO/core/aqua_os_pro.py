@@ -9,14 +9,46 @@ Study Case: Madrid (LEMD) → Naples (LIRN) route optimization
 """
 
 import asyncio
+import collections
+import copy
+import hashlib
+import json
 import logging
+import math
+import os
+import time
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from enum import Enum
+from functools import lru_cache, partial
 from typing import Dict, List, Optional, Tuple
 import yaml
 import numpy as np
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Use the libyaml parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Run the kernel as plain Python when numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 # Quantum-Classical Bridge Components
 # Placeholder implementations for missing modules/classes
 class ClassicalNMPCOptimizer:
@@ -53,6 +85,74 @@ class QuantumStateManager:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Optimization results kept in memory for a continuous run
+HISTORY_MAXLEN = 1000
+
+@njit(cache=True, fastmath=True)
+def _bearing_scalar(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Initial great-circle bearing in degrees [0, 360) between two points"""
+    lat1 = math.radians(lat1)
+    lat2 = math.radians(lat2)
+    dlon = math.radians(lon2 - lon1)
+    
+    y = math.sin(dlon) * math.cos(lat2)
+    x = math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * math.cos(lat2) * math.cos(dlon)
+    
+    return (math.degrees(math.atan2(y, x)) + 360.0) % 360.0
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _bearing_vec(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+        """Bearings between consecutive waypoints of a trajectory (N points -> N-1 legs)"""
+        n = lat.shape[0] - 1
+        out = np.empty(max(n, 0), dtype=np.float64)
+        for i in prange(n):
+            out[i] = _bearing_scalar(lat[i], lon[i], lat[i + 1], lon[i + 1])
+        return out
+else:
+    def _bearing_vec(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+        """Bearings between consecutive waypoints of a trajectory (N points -> N-1 legs)"""
+        lat = np.radians(lat)
+        dlon = np.radians(np.diff(lon))
+        lat1, lat2 = lat[:-1], lat[1:]
+        
+        y = np.sin(dlon) * np.cos(lat2)
+        x = np.cos(lat1) * np.sin(lat2) - np.sin(lat1) * np.cos(lat2) * np.cos(dlon)
+        
+        return (np.degrees(np.arctan2(y, x)) + 360.0) % 360.0
+
+# FMS safety bounds; immutable so every delta can share them
+_ALT_LIMITS = (30000, 42000)  # FL300-FL420
+_SPD_LIMITS = (250, 500)  # Knots
+
+# Column layout of the structure-of-arrays trajectory view
+TRAJECTORY_COLUMNS = ("latitude", "longitude", "altitude_ft")
+
+def trajectory_to_array(trajectory_4d: List[Dict]) -> np.ndarray:
+    """Pack 4D trajectory waypoints into an (N, 3) float64 array of TRAJECTORY_COLUMNS"""
+    return np.array(
+        [(wp["latitude"], wp["longitude"], wp["altitude_ft"]) for wp in trajectory_4d],
+        dtype=np.float64
+    ).reshape(-1, len(TRAJECTORY_COLUMNS))
+
+def _json_default(obj):
+    """Encode the numpy, enum and datetime values found in results for stdlib json"""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+@lru_cache(maxsize=8)
+def _load_yaml(path: str, mtime: float) -> Dict:
+    """Parse a YAML config file; mtime is part of the key so edits are picked up"""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
 class AquaOSProState(Enum):
     """AQUA OS PRO operational states"""
     INITIALIZING = "initializing"
@@ -61,7 +161,10 @@ class AquaOSProState(Enum):
     CONVERGED = "converged"
     ERROR = "error"
 
-@dataclass
+# States in which the continuous optimization loop keeps running
+_RUNNING_STATES = frozenset({AquaOSProState.READY, AquaOSProState.CONVERGED})
+
+@dataclass(slots=True)
 class RouteOptimizationRequest:
     """Route optimization request structure"""
     aircraft_state: Dict
@@ -70,7 +173,7 @@ class RouteOptimizationRequest:
     optimization_horizon_min: int = 10
     update_interval_sec: int = 30
 
-@dataclass
+@dataclass(slots=True)
 class OptimizationResult:
     """Complete optimization result with quantum provenance"""
     trajectory_4d: List[Dict]  # lat, lon, alt, time waypoints
@@ -80,6 +183,16 @@ class OptimizationResult:
     quantum_enhanced: bool
     computation_time_ms: float
     provenance_record: Dict
+    trajectory_arr: Optional[np.ndarray] = None  # trajectory_4d as TRAJECTORY_COLUMNS rows
+    
+    def to_bytes(self) -> bytes:
+        """Serialize the result to UTF-8 JSON, with orjson when available"""
+        if ORJSON_AVAILABLE:
+            # Non-str keys are stringified, as stdlib json does
+            return orjson.dumps(
+                self, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            )
+        return json.dumps(asdict(self), default=_json_default).encode("utf-8")
 
 class AquaOSProEngine:
     """
@@ -95,9 +208,25 @@ class AquaOSProEngine:
         # Initialize quantum-classical bridge components
         self._initialize_bridge_components()
         
-        # Performance tracking
-        self.optimization_history = []
+        # Performance tracking (running totals cover every optimization,
+        # not only the results still held in the bounded history)
+        self.optimization_history = collections.deque(maxlen=HISTORY_MAXLEN)
         self.performance_metrics = {}
+        self._optimization_count = 0
+        self._sum_ms = 0.0
+        self._sum_quantum = 0
+        self._conf_window = collections.deque(maxlen=10)
+        
+        # UTCS identifiers only change once per second
+        self._id_prefix = f"AQUA-OS-PRO/{self._cfg_callsign}/TRAJ/"
+        self._id_last_sec = -1
+        self._id_last = ""
+        
+        # Set to end the continuous optimization loop without waiting out the cycle;
+        # created by the loop itself so it binds to the loop's event loop
+        self._stop_event: Optional[asyncio.Event] = None
+        # A stop requested while no loop is running, honoured by the next start
+        self._stop_pending = False
         
         self.state = AquaOSProState.READY
         logger.info("AQUA OS PRO Engine initialized successfully")
@@ -137,8 +266,8 @@ class AquaOSProEngine:
             }
         
         try:
-            with open(config_path, 'r') as f:
-                return yaml.safe_load(f)
+            # Parsed once per file version; each engine gets its own copy
+            return copy.deepcopy(_load_yaml(config_path, os.path.getmtime(config_path)))
         except (FileNotFoundError, PermissionError, OSError) as e:
             logger.error(f"Failed to open config file '{config_path}': {e}")
             raise
@@ -146,13 +275,21 @@ class AquaOSProEngine:
     def _initialize_bridge_components(self):
         """Initialize quantum-classical bridge components"""
         
+        # Config values read on every optimization cycle
+        self._cfg_callsign = self.config["aircraft"]["callsign"]
+        self._cfg_max_bank = self.config["aircraft"]["max_bank_angle"]
+        self._cfg_quantum_enabled = self.config["quantum_bridge"]["enable_quantum_enhancement"]
+        self._cfg_scenarios = self.config["quantum_bridge"]["ensemble_scenarios"]
+        self._cfg_horizon = self.config["optimization"]["horizon_minutes"]
+        self._cfg_update_interval = self.config["optimization"]["update_interval_seconds"]
+        
         # CB: Classical Bit - Deterministic NMPC optimizer
         self.classical_optimizer = ClassicalNMPCOptimizer(
             config=self.config["optimization"]
         )
         
         # QB: Quantum Bit - Quantum ensemble optimizer (optional)
-        if self.config["quantum_bridge"]["enable_quantum_enhancement"]:
+        if self._cfg_quantum_enabled:
             self.quantum_optimizer = QuantumEnsembleOptimizer(
                 config=self.config["quantum_bridge"]
             )
@@ -168,7 +305,7 @@ class AquaOSProEngine:
         
         # FWD: Wave Dynamics - Predictive trajectory generator
         self.wave_predictor = WaveDynamicsPredictor(
-            horizon_minutes=self.config["optimization"]["horizon_minutes"]
+            horizon_minutes=self._cfg_horizon
         )
         
         # QS: Quantum State - State management and provenance
@@ -179,16 +316,20 @@ class AquaOSProEngine:
         Execute complete quantum-classical bridge optimization
         CB → QB → UE/FE → FWD → QS flow
         """
-        start_time = datetime.utcnow()
+        start_ns = time.perf_counter_ns()
         self.state = AquaOSProState.OPTIMIZING
         
         try:
-            # Step 1: CB (Classical Bit) - Deterministic optimization
+            # Step 1: CB (Classical Bit) - Deterministic optimization, overlapped
+            # with UE extraction which only depends on the weather data
             logger.info("CB: Executing classical NMPC optimization")
-            classical_solution = await self._execute_classical_optimization(request)
+            classical_solution, unit_elements = await asyncio.gather(
+                self._execute_classical_optimization(request),
+                self._extract_unit_elements(request.meteorological_data)
+            )
             
             # Step 2: CB → QB - Quantum enhancement (optional)
-            if self.quantum_optimizer and self.config["quantum_bridge"]["enable_quantum_enhancement"]:
+            if self.quantum_optimizer and self._cfg_quantum_enabled:
                 logger.info("QB: Applying quantum ensemble enhancement")
                 quantum_solution = await self._execute_quantum_enhancement(
                     classical_solution, request
@@ -202,7 +343,7 @@ class AquaOSProEngine:
             # Step 3: QB → UE/FE - Element processing and federation
             logger.info("UE/FE: Processing elements and federation entanglement")
             federated_elements = await self._process_elements_federation(
-                enhanced_solution, request
+                enhanced_solution, unit_elements
             )
             
             # Step 4: UE/FE → FWD - Wave dynamics prediction
@@ -218,16 +359,19 @@ class AquaOSProEngine:
             )
             
             # Generate final result
-            computation_time = (datetime.utcnow() - start_time).total_seconds() * 1000
+            computation_time = (time.perf_counter_ns() - start_ns) / 1e6
             
             result = OptimizationResult(
                 trajectory_4d=qs_artifact["trajectory_4d"],
                 qs_state=qs_artifact["qs_state"],
                 confidence_metrics=qs_artifact["confidence_metrics"],
-                fms_deltas=self._generate_fms_deltas(qs_artifact["trajectory_4d"]),
+                fms_deltas=self._generate_fms_deltas(
+                    qs_artifact["trajectory_4d"], qs_artifact["trajectory_arr"]
+                ),
                 quantum_enhanced=quantum_enhanced,
                 computation_time_ms=computation_time,
-                provenance_record=qs_artifact["provenance"]
+                provenance_record=qs_artifact["provenance"],
+                trajectory_arr=qs_artifact["trajectory_arr"]
             )
             
             # Archive optimization
@@ -246,12 +390,20 @@ class AquaOSProEngine:
     
     async def _execute_classical_optimization(self, request: RouteOptimizationRequest) -> Dict:
         """CB Layer: Execute deterministic classical optimization"""
-        return await self.classical_optimizer.optimize(
+        optimize = partial(
+            self.classical_optimizer.optimize,
             aircraft_state=request.aircraft_state,
             weather_data=request.meteorological_data,
             constraints=request.constraints,
             horizon_minutes=request.optimization_horizon_min
         )
+        if asyncio.iscoroutinefunction(self.classical_optimizer.optimize):
+            return await optimize()
+        
+        # A synchronous solve runs in a worker thread so it does not block the
+        # event loop or the UE extraction gathered with it; a process pool
+        # would cost more than the placeholder solve
+        return await asyncio.to_thread(optimize)
     
     async def _execute_quantum_enhancement(self, classical_solution: Dict, request: RouteOptimizationRequest) -> Dict:
         """QB Layer: Apply quantum ensemble enhancement"""
@@ -262,19 +414,21 @@ class AquaOSProEngine:
             return await self.quantum_optimizer.enhance_solution(
                 classical_baseline=classical_solution,
                 uncertainty_ensemble=request.meteorological_data.get("ensemble", {}),
-                scenarios=self.config["quantum_bridge"]["ensemble_scenarios"]
+                scenarios=self._cfg_scenarios
             )
         except Exception as e:
             logger.warning(f"Quantum enhancement failed, using classical fallback: {e}")
             return classical_solution
     
-    async def _process_elements_federation(self, solution: Dict, request: RouteOptimizationRequest) -> Dict:
-        """UE/FE Layer: Process unit elements and apply federation entanglement"""
-        
-        # UE: Extract and normalize unit elements
-        unit_elements = self.unit_elements.extract_from_weather(
-            request.meteorological_data
+    async def _extract_unit_elements(self, meteorological_data: Dict) -> Dict:
+        """UE Layer: Extract and normalize unit elements from weather data"""
+        # Runs in a worker thread so it overlaps the CB optimization
+        return await asyncio.to_thread(
+            self.unit_elements.extract_from_weather, meteorological_data
         )
+    
+    async def _process_elements_federation(self, solution: Dict, unit_elements: Dict) -> Dict:
+        """UE/FE Layer: Apply risk fields to unit elements and federation entanglement"""
         
         risk_elements = self.risk_processor.process_risk_fields(
             unit_elements, solution["trajectory"]
@@ -284,7 +438,7 @@ class AquaOSProEngine:
         federated_elements = await self.federation_manager.federate(
             local_elements={**unit_elements, **risk_elements},
             solution_context=solution,
-            aircraft_id=self.config["aircraft"]["callsign"]
+            aircraft_id=self._cfg_callsign
         )
         
         return federated_elements
@@ -304,16 +458,31 @@ class AquaOSProEngine:
             wave_dynamics=wave_prediction,
             optimization_context={
                 "aircraft": self.config["aircraft"],
-                "request": request.__dict__,
+                # Identify the inputs without keeping the (possibly large)
+                # weather ensemble alive through the optimization history
+                "request": {
+                    "aircraft_state_digest": self._digest(request.aircraft_state),
+                    "constraints": request.constraints,
+                    "optimization_horizon_min": request.optimization_horizon_min,
+                    "update_interval_sec": request.update_interval_sec
+                },
                 "quantum_enhanced": quantum_enhanced,
                 "timestamp": datetime.utcnow().isoformat()
             },
             initial_state=QSState.PROPOSED  # α state
         )
+        qs_artifact["trajectory_arr"] = trajectory_to_array(qs_artifact["trajectory_4d"])
         
         return qs_artifact
     
-    def _generate_fms_deltas(self, trajectory_4d: List[Dict]) -> Dict:
+    @staticmethod
+    def _digest(data: Dict) -> str:
+        """Stable 128-bit digest of a JSON-like mapping"""
+        canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+    
+    def _generate_fms_deltas(self, trajectory_4d: List[Dict],
+                             trajectory_arr: Optional[np.ndarray] = None) -> Dict:
         """Generate FMS delta commands from 4D trajectory"""
         if not trajectory_4d:
             return {}
@@ -321,11 +490,14 @@ class AquaOSProEngine:
         current_waypoint = trajectory_4d[0]
         next_waypoint = trajectory_4d[1] if len(trajectory_4d) > 1 else current_waypoint
         
-        # Calculate heading change
-        heading_change = self._calculate_bearing(
-            current_waypoint["latitude"], current_waypoint["longitude"],
-            next_waypoint["latitude"], next_waypoint["longitude"]
+        # Bearings of every leg in one pass over the array view
+        if trajectory_arr is None:
+            trajectory_arr = trajectory_to_array(trajectory_4d)
+        leg_bearings = _bearing_vec(
+            np.ascontiguousarray(trajectory_arr[:, 0]),
+            np.ascontiguousarray(trajectory_arr[:, 1])
         )
+        heading_change = float(leg_bearings[0]) if leg_bearings.size else 0.0
         
         # Calculate altitude change
         altitude_change = next_waypoint["altitude_ft"] - current_waypoint["altitude_ft"]
@@ -345,52 +517,64 @@ class AquaOSProEngine:
                     "rate_fpm": min(abs(altitude_change) * 10, 2000)  # Max 2000 fpm
                 }
             },
+            "leg_bearings": leg_bearings.tolist(),
             "safety_bounds": {
-                "max_bank_angle": self.config["aircraft"]["max_bank_angle"],
-                "altitude_limits": [30000, 42000],  # FL300-FL420
-                "speed_limits": [250, 500]  # Knots
+                "max_bank_angle": self._cfg_max_bank,
+                "altitude_limits": _ALT_LIMITS,
+                "speed_limits": _SPD_LIMITS
             }
         }
     
-    def _calculate_bearing(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-        """Calculate bearing between two points"""
-        lat1, lon1, lat2, lon2 = map(np.radians, [lat1, lon1, lat2, lon2])
-        dlon = lon2 - lon1
-        
-        y = np.sin(dlon) * np.cos(lat2)
-        x = np.cos(lat1) * np.sin(lat2) - np.sin(lat1) * np.cos(lat2) * np.cos(dlon)
-        
-        bearing = np.degrees(np.arctan2(y, x))
-        return (bearing + 360) % 360
-    
     def _generate_utcs_id(self) -> str:
         """Generate UTCS-MI v5.0 compliant identifier"""
-        timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
-        return f"AQUA-OS-PRO/{self.config['aircraft']['callsign']}/TRAJ/{timestamp}"
+        now = int(time.time())
+        if now != self._id_last_sec:
+            self._id_last_sec = now
+            self._id_last = self._id_prefix + time.strftime("%Y%m%d%H%M%S", time.gmtime(now))
+        return self._id_last
     
     def _update_performance_metrics(self, result: OptimizationResult):
         """Update performance tracking metrics"""
+        self._optimization_count += 1
+        self._sum_ms += result.computation_time_ms
+        self._sum_quantum += int(result.quantum_enhanced)
+        self._conf_window.append(result.confidence_metrics.get("overall", 0.0))
+        
+        count = self._optimization_count
         self.performance_metrics.update({
-            "total_optimizations": len(self.optimization_history),
-            "avg_computation_time_ms": np.mean([r.computation_time_ms for r in self.optimization_history]),
-            "quantum_enhancement_rate": np.mean([r.quantum_enhanced for r in self.optimization_history]),
+            "total_optimizations": count,
+            "avg_computation_time_ms": self._sum_ms / count,
+            "quantum_enhancement_rate": self._sum_quantum / count,
             "last_optimization": result.computation_time_ms,
-            "confidence_trend": np.mean([r.confidence_metrics.get("overall", 0.0) for r in self.optimization_history[-10:]])
+            "confidence_trend": sum(self._conf_window) / len(self._conf_window)
         })
     
     async def start_continuous_optimization(self, route_config: Dict):
         """Start continuous optimization loop for real-time operation"""
         logger.info("Starting continuous optimization loop")
+        self._stop_event = asyncio.Event()
+        if self._stop_pending:
+            self._stop_pending = False
+            self._stop_event.set()
+        
+        try:
+            await self._run_optimization_loop(route_config)
+        finally:
+            self._stop_event = None
         
-        while self.state in [AquaOSProState.READY, AquaOSProState.CONVERGED]:
+        logger.info("Continuous optimization loop stopped")
+    
+    async def _run_optimization_loop(self, route_config: Dict):
+        """Optimize every update interval until stopped or out of a running state"""
+        while self.state in _RUNNING_STATES and not self._stop_event.is_set():
             try:
                 # Create optimization request from current state
                 request = RouteOptimizationRequest(
                     aircraft_state=await self._get_current_aircraft_state(),
                     meteorological_data=await self._get_current_weather_data(),
                     constraints=route_config.get("constraints", {}),
-                    optimization_horizon_min=self.config["optimization"]["horizon_minutes"],
-                    update_interval_sec=self.config["optimization"]["update_interval_seconds"]
+                    optimization_horizon_min=self._cfg_horizon,
+                    update_interval_sec=self._cfg_update_interval
                 )
                 
                 # Execute optimization
@@ -400,11 +584,28 @@ class AquaOSProEngine:
                 await self._publish_optimization_results(result)
                 
                 # Wait for next optimization cycle
-                await asyncio.sleep(self.config["optimization"]["update_interval_seconds"])
+                await self._wait_for_stop(self._cfg_update_interval)
                 
             except Exception as e:
                 logger.error(f"Continuous optimization error: {e}")
-                await asyncio.sleep(5)  # Short delay before retry
+                await self._wait_for_stop(5)  # Short delay before retry
+    
+    def stop_continuous_optimization(self):
+        """Stop the continuous optimization loop at once, even mid-wait
+        
+        Called before the loop starts, the stop applies to the next start.
+        """
+        if self._stop_event is not None:
+            self._stop_event.set()
+        else:
+            self._stop_pending = True
+    
+    async def _wait_for_stop(self, timeout: float):
+        """Sleep for up to timeout seconds, returning early once a stop is requested"""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
     
     async def _get_current_aircraft_state(self) -> Dict:
         """Get current aircraft state from sensors"""
@@ -429,7 +630,7 @@ class AquaOSProEngine:
     
     async def _publish_optimization_results(self, result: OptimizationResult):
         """Publish optimization results to domain interfaces"""
-        # Placeholder - would publish to actual messaging system
+        # Placeholder - would publish result.to_bytes() to actual messaging system
         logger.info(f"Publishing optimization results: QS={result.qs_state.value}, "
                    f"confidence={result.confidence_metrics.get('overall', 0.0):.2f}")
 
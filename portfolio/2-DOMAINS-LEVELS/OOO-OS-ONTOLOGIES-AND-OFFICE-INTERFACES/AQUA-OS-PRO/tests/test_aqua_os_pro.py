@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Tests for AQUA OS PRO engine
+"""
+
+import asyncio
+import importlib
+import json
+import threading
+import unittest
+import sys
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+# Add AQUA OS PRO core to path
+sys.path.append(str(Path(__file__).parent.parent / "core"))
+
+import aqua_os_pro
+from aqua_os_pro import (
+    AquaOSProEngine, OptimizationResult, QSState, RouteOptimizationRequest,
+    trajectory_to_array
+)
+
+def make_result():
+    """Build a result holding numpy, enum, datetime and int-keyed values"""
+    trajectory_4d = [
+        {"latitude": 40.4936, "longitude": -3.5668, "altitude_ft": 37000},
+        {"latitude": 40.8860, "longitude": 14.2908, "altitude_ft": 37000}
+    ]
+    return OptimizationResult(
+        trajectory_4d=trajectory_4d,
+        qs_state=QSState.UPDATED,
+        confidence_metrics={"overall": np.float64(0.92), 3: "ensemble"},
+        fms_deltas={"leg_bearings": np.array([84.5])},
+        quantum_enhanced=True,
+        computation_time_ms=12.5,
+        provenance_record={"created": datetime(2026, 10, 16, 12, 30, 45, 123456)},
+        trajectory_arr=trajectory_to_array(trajectory_4d)
+    )
+
+class TestOptimizationResult(unittest.TestCase):
+    """Test optimization result serialization"""
+
+    def _decode(self, orjson_available):
+        with mock.patch.object(aqua_os_pro, "ORJSON_AVAILABLE", orjson_available):
+            return json.loads(make_result().to_bytes())
+
+    def test_stdlib_encoding(self):
+        """Test the stdlib path encodes every value type"""
+        doc = self._decode(False)
+        self.assertEqual(doc["qs_state"], "updated")
+        self.assertEqual(doc["provenance_record"]["created"], "2026-10-16T12:30:45.123456")
+        self.assertEqual(doc["confidence_metrics"]["3"], "ensemble")
+        self.assertEqual(doc["trajectory_arr"][1], [40.8860, 14.2908, 37000.0])
+
+    @unittest.skipUnless(aqua_os_pro.ORJSON_AVAILABLE, "orjson not available")
+    def test_orjson_matches_stdlib(self):
+        """Test orjson and stdlib json produce the same document"""
+        self.assertEqual(self._decode(True), self._decode(False))
+
+class TestBearings(unittest.TestCase):
+    """Test trajectory leg bearings"""
+
+    def setUp(self):
+        self.trajectory_4d = [
+            {"latitude": 40.4936, "longitude": -3.5668, "altitude_ft": 37000},
+            {"latitude": 41.2000, "longitude": 2.1000, "altitude_ft": 37000},
+            {"latitude": 40.8860, "longitude": 14.2908, "altitude_ft": 35000}
+        ]
+        self.arr = trajectory_to_array(self.trajectory_4d)
+
+    def test_fms_deltas_leg_bearings_are_plain_floats(self):
+        """Test FMS deltas keep no numpy arrays"""
+        deltas = AquaOSProEngine()._generate_fms_deltas(self.trajectory_4d, self.arr)
+        self.assertIsInstance(deltas["leg_bearings"], list)
+        self.assertEqual(len(deltas["leg_bearings"]), 2)
+        json.dumps(deltas)
+
+    def test_fallback_matches_scalar_kernel(self):
+        """Test the numpy bearing fallback used without numba"""
+        with mock.patch.dict(sys.modules, {"numba": None, "aqua_os_pro": None}):
+            del sys.modules["aqua_os_pro"]
+            fallback = importlib.import_module("aqua_os_pro")
+        self.assertFalse(fallback.NUMBA_AVAILABLE)
+        lat, lon = self.arr[:, 0], self.arr[:, 1]
+        expected = [
+            aqua_os_pro._bearing_scalar(lat[i], lon[i], lat[i + 1], lon[i + 1])
+            for i in range(len(lat) - 1)
+        ]
+        np.testing.assert_allclose(fallback._bearing_vec(lat, lon), expected)
+        self.assertEqual(fallback._bearing_vec(lat[:1], lon[:1]).size, 0)
+
+class TestClassicalOptimization(unittest.TestCase):
+    """Test the CB optimization step"""
+
+    def test_sync_solver_runs_off_event_loop(self):
+        """Test a synchronous solver runs in a worker thread"""
+        request = RouteOptimizationRequest(aircraft_state={}, meteorological_data={}, constraints={})
+        engine = AquaOSProEngine()
+        engine.classical_optimizer.optimize = lambda **kwargs: {"thread": threading.get_ident(), **kwargs}
+        solution = asyncio.run(engine._execute_classical_optimization(request))
+        self.assertNotEqual(solution["thread"], threading.get_ident())
+        self.assertEqual(solution["horizon_minutes"], 10)
+
+class TestContinuousOptimization(unittest.TestCase):
+    """Test the continuous optimization loop"""
+
+    async def _run_and_stop(self, engine):
+        task = asyncio.create_task(engine.start_continuous_optimization({}))
+        await asyncio.sleep(0.05)
+        engine.stop_continuous_optimization()
+        await asyncio.wait_for(task, timeout=1)
+
+    def test_stop_before_start_is_honoured(self):
+        """Test a stop requested before the loop starts ends it at once"""
+        engine = AquaOSProEngine()
+        engine.stop_continuous_optimization()
+        with mock.patch.object(engine, "optimize_route") as optimize_route:
+            asyncio.run(asyncio.wait_for(engine.start_continuous_optimization({}), timeout=1))
+        optimize_route.assert_not_called()
+        self.assertFalse(engine._stop_pending)
+
+    def test_loop_restarts_on_new_event_loop(self):
+        """Test the loop stops promptly across separate asyncio.run calls"""
+        engine = AquaOSProEngine()
+        for _ in range(2):
+            engine.state = aqua_os_pro.AquaOSProState.READY
+            asyncio.run(self._run_and_stop(engine))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+AQUA OS PRO Layer Base Implementation
+
+Shared core for the per-domain TFA layer modules
+(<DOMAIN>/TFA/<GROUP>/<LAYER>/aqua_pro_implementation.py). Each layer module
+calls make_aqua_pro_layer() with its domain, layer and extra config fields
+and re-exports the result under its layer-specific names.
+
+Layer modules import this module by name, so 2-DOMAINS-LEVELS must be on the
+import path (the AQUA OS PRO validator adds it; set PYTHONPATH to run a layer
+module directly).
+"""
+
+import atexit
+import logging
+import queue
+import threading
+from dataclasses import make_dataclass
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from time import time as _now
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Sequence, Tuple
+
+# Logging is configured by the application; stay silent otherwise
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    logger.addHandler(logging.NullHandler())
+
+_log_listener: Optional[QueueListener] = None
+_log_handler: Optional[QueueHandler] = None
+# Every logger layer records go to; async logging reroutes all of them
+_layer_loggers: List[logging.Logger] = [logger]
+
+def _layer_logger(name: str) -> logging.Logger:
+    """Logger for one layer module, silent unless the application configures logging"""
+    layer_logger = logging.getLogger(name)
+    if layer_logger not in _layer_loggers:
+        if not layer_logger.handlers:
+            layer_logger.addHandler(logging.NullHandler())
+        _layer_loggers.append(layer_logger)
+        if _log_handler is not None:
+            layer_logger.addHandler(_log_handler)
+            layer_logger.propagate = False
+    return layer_logger
+
+def enable_async_logging(*handlers: logging.Handler) -> QueueListener:
+    """Emit AQUA OS PRO layer log records from a background thread
+
+    Log calls on the request path then only enqueue the record; the given
+    handlers (stderr by default) run on the listener thread, which is
+    drained at interpreter exit.
+    """
+    global _log_listener, _log_handler
+    if _log_listener is None:
+        log_queue = queue.SimpleQueue()
+        _log_listener = QueueListener(log_queue, *(handlers or (logging.StreamHandler(),)),
+                                      respect_handler_level=True)
+        _log_handler = QueueHandler(log_queue)
+        for layer_logger in _layer_loggers:
+            layer_logger.addHandler(_log_handler)
+            layer_logger.propagate = False
+        _log_listener.start()
+        atexit.register(disable_async_logging)
+    return _log_listener
+
+def disable_async_logging() -> None:
+    """Flush queued log records and go back to synchronous propagation"""
+    global _log_listener, _log_handler
+    if _log_listener is not None:
+        for layer_logger in _layer_loggers:
+            layer_logger.removeHandler(_log_handler)
+            layer_logger.propagate = True
+        _log_listener.stop()
+        _log_listener = _log_handler = None
+
+class AquaProImplementation:
+    """Implementation of an AQUA OS PRO layer for one domain"""
+
+    __slots__ = ("config", "initialized", "_status_template", "_result_template")
+
+    # Replaced per layer by make_aqua_pro_layer with the layer module's logger
+    _logger = logger
+
+    def __init__(self, config):
+        self.config = config
+        self.initialized = False
+        # Config is frozen, so only "initialized" ever changes
+        self._status_template = {
+            "layer": config.layer,
+            "domain": config.domain,
+            "initialized": False,
+            "version": config.version,
+            "enabled": config.enabled
+        }
+        self._result_template = {
+            "status": "success",
+            "layer": config.layer,
+            "domain": config.domain,
+            "processed_at": 0.0,
+            "output": None
+        }
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info("Initializing AQUA PRO %s for %s", config.layer, config.domain)
+
+    def initialize(self, config) -> bool:
+        """Initialize the layer"""
+        # TODO: Implement initialization logic
+
+        self.initialized = True
+        self._status_template["initialized"] = True
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info("%s layer initialized successfully", self.config.layer)
+        return True
+
+    def process(self, input_data: Dict[str, Any], _now=_now,
+                _RuntimeError=RuntimeError) -> Dict[str, Any]:
+        """Process data through the layer"""
+        if not self.initialized:
+            raise _RuntimeError(f"{self.config.layer} layer not initialized")
+
+        # TODO: Implement processing logic
+
+        result = self._result_template.copy()
+        result["processed_at"] = _now()
+        # Fresh per call so callers never share the output dict
+        result["output"] = {"data": "processed"}
+        return result
+
+    def process_batch(self, inputs: List[Dict[str, Any]], _now=_now,
+                      _RuntimeError=RuntimeError) -> List[Dict[str, Any]]:
+        """Process many inputs through the layer with one timestamp"""
+        if not self.initialized:
+            raise _RuntimeError(f"{self.config.layer} layer not initialized")
+
+        template = self._result_template
+        processed_at = _now()
+        return [
+            {**template, "processed_at": processed_at, "output": {"data": "processed"}}
+            for _input in inputs
+        ]
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get current status of the layer"""
+        return self._status_template.copy()
+
+def make_aqua_pro_layer(domain: str, layer: str,
+                        extra_fields: Sequence[Tuple[str, type, Any]] = (),
+                        logger_name: Optional[str] = None) -> Tuple[type, type, Callable, Callable]:
+    """Build the config class, implementation class and factories for a layer
+
+    Returns ``(AquaProConfig, AquaPro<LAYER>Implementation, create, initialize)``.
+    domain, layer and version are class constants of the config; the
+    ``extra_fields`` (name, type, default) become its per-instance fields.
+    ``create`` returns one shared implementation per distinct hashable config and
+    ``initialize`` additionally builds the config from a dict and
+    initializes the instance once. The layer logs through ``logger_name``
+    (pass the layer module's ``__name__``), or this module's logger; both
+    classes are attributed to that module so their instances pickle by
+    reference to the names the layer module re-exports.
+    """
+    module_name = logger_name or __name__
+    config_cls = make_dataclass(
+        "AquaProConfig",
+        [("domain", ClassVar[str], domain),
+         ("layer", ClassVar[str], layer),
+         ("version", ClassVar[str], "v1.0.0"),
+         ("enabled", bool, True),
+         *extra_fields],
+        frozen=True,
+        slots=True
+    )
+    config_cls.__doc__ = f"Configuration for AQUA OS PRO {layer} layer"
+    # make_dataclass only takes module= from Python 3.12
+    config_cls.__module__ = module_name
+
+    impl_cls = type(f"AquaPro{layer}Implementation", (AquaProImplementation,), {
+        "__slots__": (),
+        "__doc__": f"Concrete implementation of {layer} layer for {domain} domain",
+        "__module__": module_name,
+        "__qualname__": f"AquaPro{layer}Implementation",
+        "_logger": _layer_logger(logger_name) if logger_name else logger
+    })
+
+    default_config = config_cls()
+    instances: Dict[Any, AquaProImplementation] = {}
+    instances_lock = threading.Lock()
+
+    def config_from_items(items: tuple):
+        kwargs = dict(items)
+        # domain/layer/version are fixed per layer; matching values are accepted
+        for name in ("domain", "layer", "version"):
+            if name in kwargs and kwargs.pop(name) != getattr(config_cls, name):
+                raise TypeError(f"AquaProConfig.{name} is fixed to {getattr(config_cls, name)!r} for this layer")
+        return config_cls(**kwargs)
+
+    cached_config_from_items = lru_cache(maxsize=64)(config_from_items)
+
+    def create(config=None):
+        """Return the shared layer instance for a config"""
+        if config is None:
+            config = default_config
+
+        try:
+            hash(config)
+        except TypeError:
+            # Configs holding unhashable values (lists, dicts) are never shared
+            return impl_cls(config)
+
+        with instances_lock:
+            implementation = instances.get(config)
+            if implementation is None:
+                implementation = impl_cls(config)
+                instances[config] = implementation
+
+        return implementation
+
+    def initialize(config: Optional[Dict[str, Any]] = None):
+        """Initialize the layer with optional configuration"""
+        if config:
+            items = tuple(sorted(config.items()))
+            try:
+                hash(items)
+            except TypeError:
+                # Unhashable values (lists, dicts) cannot key the cache
+                aqua_config = config_from_items(items)
+            else:
+                aqua_config = cached_config_from_items(items)
+        else:
+            aqua_config = default_config
+
+        implementation = create(aqua_config)
+        if not implementation.initialized:
+            implementation.initialize(aqua_config)
+
+        return implementation
+
+    return config_cls, impl_cls, create, initialize
+
+def run_example(implementation: AquaProImplementation) -> None:
+    """Print status and a sample result for an initialized layer"""
+    config = implementation.config
+    print(f"AQUA OS PRO {config.layer} Layer - {config.domain} Domain")
+
+    # Check status
+    status = implementation.get_status()
+    print(f"Status: {status}")
+
+    # Process sample data
+    sample_input = {"test": "data", "domain": config.domain, "layer": config.layer}
+    result = implementation.process(sample_input)
+    print(f"Result: {result}")
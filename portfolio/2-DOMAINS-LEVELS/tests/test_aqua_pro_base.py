@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared AQUA OS PRO layer base
+"""
+
+import logging
+import pickle
+import unittest
+import sys
+from pathlib import Path
+
+# Add 2-DOMAINS-LEVELS to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from aqua_pro_base import disable_async_logging, enable_async_logging, make_aqua_pro_layer
+
+# Re-exported at module level like a layer module, so configs pickle by reference
+AquaProConfig, AquaProCBImplementation, create_aqua_pro_cb, initialize_cb = make_aqua_pro_layer(
+    "TST", "CB", extra_fields=[("waypoints", object, None)], logger_name=__name__)
+
+class _ListHandler(logging.Handler):
+    """Collect emitted records"""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+class TestAquaProLayer(unittest.TestCase):
+    """Test layers built by make_aqua_pro_layer"""
+
+    def test_config_constants(self):
+        """Test domain, layer and version are fixed per layer"""
+        config = AquaProConfig()
+        self.assertEqual((config.domain, config.layer, config.version), ("TST", "CB", "v1.0.0"))
+        self.assertEqual(AquaProConfig.__module__, __name__)
+        self.assertEqual(AquaProCBImplementation.__qualname__, "AquaProCBImplementation")
+
+    def test_fixed_fields_rejected(self):
+        """Test overriding domain/layer/version raises TypeError"""
+        for name in ("domain", "layer", "version"):
+            with self.assertRaises(TypeError):
+                initialize_cb({name: "other", "enabled": False})
+        self.assertTrue(initialize_cb({"domain": "TST", "enabled": False}).initialized)
+
+    def test_instance_shared_per_config(self):
+        """Test equal configs share one instance and distinct configs do not"""
+        first = initialize_cb({"enabled": True, "waypoints": ("LEMD", "LIRN")})
+        second = initialize_cb({"waypoints": ("LEMD", "LIRN"), "enabled": True})
+        other = initialize_cb({"waypoints": ("LEMD",)})
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertIs(create_aqua_pro_cb(), initialize_cb())
+
+    def test_unhashable_config_not_shared(self):
+        """Test configs holding unhashable values get their own instance"""
+        first = initialize_cb({"waypoints": ["LEMD", "LIRN"]})
+        second = initialize_cb({"waypoints": ["LEMD", "LIRN"]})
+
+        self.assertIsNot(first, second)
+        self.assertTrue(first.initialized)
+        self.assertEqual(first.config, second.config)
+        self.assertIsInstance(create_aqua_pro_cb(first.config), AquaProCBImplementation)
+
+    def test_config_pickles(self):
+        """Test layer configs survive a pickle round trip"""
+        config = AquaProConfig(waypoints=("LEMD", "LIRN"))
+        self.assertEqual(pickle.loads(pickle.dumps(config)), config)
+
+    def test_process_batch(self):
+        """Test batch processing shares one timestamp but not output dicts"""
+        with self.assertRaises(RuntimeError):
+            AquaProCBImplementation(AquaProConfig()).process_batch([{}])
+
+        results = initialize_cb().process_batch([{"n": 1}, {"n": 2}, {"n": 3}])
+        self.assertEqual(len(results), 3)
+        self.assertEqual(len({r["processed_at"] for r in results}), 1)
+        self.assertIsNot(results[0]["output"], results[1]["output"])
+        self.assertEqual(results[0]["layer"], "CB")
+
+class TestAsyncLogging(unittest.TestCase):
+    """Test background-thread logging for layer modules"""
+
+    def tearDown(self):
+        disable_async_logging()
+
+    def test_records_routed_through_listener(self):
+        """Test layer records reach the listener's handlers and propagation is restored"""
+        handler = _ListHandler()
+        layer_logger = logging.getLogger(__name__)
+        layer_logger.setLevel(logging.INFO)
+
+        self.assertIs(enable_async_logging(handler), enable_async_logging())
+        self.assertFalse(layer_logger.propagate)
+        AquaProCBImplementation(AquaProConfig(enabled=False))
+        disable_async_logging()
+
+        self.assertTrue(layer_logger.propagate)
+        self.assertEqual([r.name for r in handler.records], [__name__])
+        self.assertEqual(handler.records[0].getMessage(), "Initializing AQUA PRO CB for TST")
+
+if __name__ == '__main__':
+    unittest.main()
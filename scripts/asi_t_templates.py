@@ -10,6 +10,12 @@ import yaml
 import sys
 from pathlib import Path
 
+# Use the libyaml emitter when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+
 
 def generate_change_notice_template(component="MOD-BASE", reason="spec update"):
     """Generate change_notice.yaml template as specified in ASI-T prompt."""
@@ -99,10 +105,10 @@ def main():
     
     if args.output:
         with open(args.output, 'w') as f:
-            yaml.dump(template, f, default_flow_style=False)
+            yaml.dump(template, f, Dumper=_Dumper, default_flow_style=False)
         print(f"✅ Template generated: {args.output}")
     else:
-        print(yaml.dump(template, default_flow_style=False))
+        print(yaml.dump(template, Dumper=_Dumper, default_flow_style=False))
     
     return 0
 
@@ -5,6 +5,7 @@ This script is idempotent: it creates missing README.md files under
 2-DOMAINS-LEVELS/<DOMAIN>/TFA/META/ with a standardized template.
 Existing files are left untouched.
 """
+import os
 from pathlib import Path
 
 DOMAINS = {
@@ -25,7 +26,9 @@ DOMAINS = {
     "PPP-PROPULSION-AND-FUEL-SYSTEMS": "PPP — PROPULSION-AND-FUEL-SYSTEMS",
 }
 
-TEMPLATE = """# {title}
+def render_template(title: str, code: str, domain_short: str, domain_code: str) -> str:
+    """Render the META README; an f-string avoids re-parsing a format template per domain"""
+    return f"""# {title}
 
 ## Purpose & Scope
 This META page captures domain-level decisions, authorship, and references for {code}. Scope: {domain_short}.
@@ -64,23 +67,39 @@ This META page captures domain-level decisions, authorship, and references for {
 - Last updated: [YYYY-MM-DD]
 """
 
+_CREATE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL
+
+def create_exclusive(path: Path) -> int:
+    """Open path for writing only if it does not exist yet (FileExistsError otherwise)"""
+    try:
+        return os.open(path, _CREATE_FLAGS, 0o644)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return os.open(path, _CREATE_FLAGS, 0o644)
+
 def main():
     root = Path(__file__).resolve().parents[1]
     base_root = root / "2-DOMAINS-LEVELS"
     for code, title in DOMAINS.items():
-        domain_short = title.split('—')[-1].strip()
-        content = TEMPLATE.format(title=title, code=code, domain_short=domain_short, domain_code=code.split('-')[0])
-        meta_dir = base_root / code / "TFA" / "META"
-        meta_dir.mkdir(parents=True, exist_ok=True)
-        readme = meta_dir / "README.md"
-        if readme.exists():
+        readme = base_root / code / "TFA" / "META" / "README.md"
+        # Existence check and create in one atomic open; existing READMEs
+        # need neither the directory nor the rendered template
+        try:
+            fd = create_exclusive(readme)
+        except FileExistsError:
             print(f"Skipping existing: {readme}")
-        else:
-            try:
-                readme.write_text(content, encoding="utf-8")
-                print(f"Created: {readme}")
-            except OSError as e:
-                print(f"Error creating {readme}: {e}")
+            continue
+        except OSError as e:
+            print(f"Error creating {readme}: {e}")
+            continue
+        domain_short = title.split('—')[-1].strip()
+        content = render_template(title, code, domain_short, code.split('-')[0])
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content.encode("utf-8"))
+            print(f"Created: {readme}")
+        except OSError as e:
+            print(f"Error creating {readme}: {e}")
 
 if __name__ == "__main__":
     main()
@@ -2,15 +2,15 @@
 """Generate META README stubs for all domains.
 
 Creates 2-DOMAINS-LEVELS/<DOMAIN>/TFA/META/README.md files
-if missing. Content matches provided stubs. Idempotent: skips
-existing files.
+if missing, for domain directories that exist. Content matches
+provided stubs. Idempotent: skips existing files.
 """
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def main():
-    root = Path('.').resolve()
-    stubs = {
-        "AAA-AERODYNAMICS-AND-AIRFRAMES-ARCHITECTURES": """# AAA — AERODYNAMICS-AND-AIRFRAMES-ARCHITECTURES
+STUBS = {
+    "AAA-AERODYNAMICS-AND-AIRFRAMES-ARCHITECTURES": """# AAA — AERODYNAMICS-AND-AIRFRAMES-ARCHITECTURES
 
 ## Purpose & Scope
 This META page captures domain-level decisions, authorship, and references for AAA. Scope: aerodynamic configuration, airframe architecture trade space, performance targets, and structural integration with other domains.
@@ -51,7 +51,7 @@ This META page captures domain-level decisions, authorship, and references for A
 - Created: [YYYY-MM-DD] by [author]
 - Last updated: [YYYY-MM-DD] — brief note
 """,
-        "AAP-AIRPORTS-PLATFORMS-AND-HYDROGEN-ENABLERS": """# AAP — AIRPORTS-PLATFORMS-AND-HYDROGEN-ENABLERS
+    "AAP-AIRPORTS-PLATFORMS-AND-HYDROGEN-ENABLERS": """# AAP — AIRPORTS-PLATFORMS-AND-HYDROGEN-ENABLERS
 
 ## Purpose & Scope
 Scope: airport adaptability, ground operations interface, scalable platform integration for AMPEL360 and city systems.
@@ -80,7 +80,7 @@ Scope: airport adaptability, ground operations interface, scalable platform inte
 ## Local Decisions / Links / Change log
 - As above
 """,
-        "CCC-COCKPIT-CABIN-AND-CARGO": """# CCC — COCKPIT-CABIN-AND-CARGO
+    "CCC-COCKPIT-CABIN-AND-CARGO": """# CCC — COCKPIT-CABIN-AND-CARGO
 
 ## Purpose & Scope
 Scope: human-machine interfaces, cabin systems, cargo handling, ergonomic design, avionics cockpit integration.
@@ -109,7 +109,7 @@ Scope: human-machine interfaces, cabin systems, cargo handling, ergonomic design
 ## Local Decisions / Links / Change log
 - ...
 """,
-        "CQH-CRYOGENICS-QUANTUM-AND-H2": """# CQH — CRYOGENICS-QUANTUM-AND-H2
+    "CQH-CRYOGENICS-QUANTUM-AND-H2": """# CQH — CRYOGENICS-QUANTUM-AND-H2
 
 ## Purpose & Scope
 Scope: cryogenic systems, hydrogen storage/handling, quantum cryo-subsystems (cold atom sensors), integration with thermal management.
@@ -138,7 +138,7 @@ Scope: cryogenic systems, hydrogen storage/handling, quantum cryo-subsystems (co
 ## Local Decisions / Links / Change log
 - ...
 """,
-        "DDD-DIGITAL-AND-DATA-DEFENSE": """# DDD — DIGITAL-AND-DATA-DEFENSE
+    "DDD-DIGITAL-AND-DATA-DEFENSE": """# DDD — DIGITAL-AND-DATA-DEFENSE
 
 ## Purpose & Scope
 Scope: cyber resilience, data governance, secure digital threads, intrusion detection, tamper-proofing.
@@ -166,7 +166,7 @@ Scope: cyber resilience, data governance, secure digital threads, intrusion dete
 ## Local Decisions / Links / Change log
 - ...
 """,
-        "EDI-ELECTRONICS-DIGITAL-INSTRUMENTS": """# EDI — ELECTRONICS-DIGITAL-INSTRUMENTS
+    "EDI-ELECTRONICS-DIGITAL-INSTRUMENTS": """# EDI — ELECTRONICS-DIGITAL-INSTRUMENTS
 
 ## Purpose & Scope
 Scope: sensors, digital instruments, data acquisition, A/D conversion, instrument calibration.
@@ -194,7 +194,7 @@ Scope: sensors, digital instruments, data acquisition, A/D conversion, instrumen
 ## Local Decisions / Links / Change log
 - ...
 """,
-        "EEE-ECOLOGICAL-EFFICIENT-ELECTRIFICATION": """# EEE — ECOLOGICAL-EFFICIENT-ELECTRIFICATION
+    "EEE-ECOLOGICAL-EFFICIENT-ELECTRIFICATION": """# EEE — ECOLOGICAL-EFFICIENT-ELECTRIFICATION
 
 ## Purpose & Scope
 Scope: electrification of propulsion/auxiliary systems, lifecycle CO2 accounting, circularity, materials selection.
@@ -222,7 +222,7 @@ Scope: electrification of propulsion/auxiliary systems, lifecycle CO2 accounting
 ## Local Decisions / Links / Change log
 - ...
 """,
-        "EER-ENVIRONMENTAL-EMISSIONS-AND-REMEDIATION": """# EER — ENVIRONMENTAL-EMISSIONS-AND-REMEDIATION
+    "EER-ENVIRONMENTAL-EMISSIONS-AND-REMEDIATION": """# EER — ENVIRONMENTAL-EMISSIONS-AND-REMEDIATION
 
 ## Purpose & Scope
 Scope: emissions monitoring, environmental remediation subsystems (e.g., Sky Cleaner), carbon accounting, sensors.
@@ -250,7 +250,7 @@ Scope: emissions monitoring, environmental remediation subsystems (e.g., Sky Cle
 ## Local Decisions / Links / Change log
 - ...
 """,
-        "IIF-INDUSTRIAL-INFRASTRUCTURE-FACILITIES": """# IIF — INDUSTRIAL-INFRASTRUCTURE-FACILITIES
+    "IIF-INDUSTRIAL-INFRASTRUCTURE-FACILITIES": """# IIF — INDUSTRIAL-INFRASTRUCTURE-FACILITIES
 
 ## Purpose & Scope
 Scope: factory design, logistics footprint, site-level digital twin deployment, maintenance infrastructure.
@@ -278,7 +278,7 @@ Scope: factory design, logistics footprint, site-level digital twin deployment,
 ## Local Decisions / Links / Change log
 - ...
 """,
-        "IIS-INTEGRATED-INTELLIGENCE-SOFTWARE": """# IIS — INTEGRATED-INTELLIGENCE-SOFTWARE
+    "IIS-INTEGRATED-INTELLIGENCE-SOFTWARE": """# IIS — INTEGRATED-INTELLIGENCE-SOFTWARE
 
 ## Purpose & Scope
 Scope: onboard & ground AI stacks, QIE (quantum inference engine), model orchestration, agent frameworks.
@@ -306,7 +306,7 @@ Scope: onboard & ground AI stacks, QIE (quantum inference engine), model orchest
 ## Local Decisions / Links / Change log
 - ...
 """,
-        "LCC-LINKAGES-CONTROL-AND-COMMUNICATIONS": """# LCC — LINKAGES-CONTROL-AND-COMMUNICATIONS
+    "LCC-LINKAGES-CONTROL-AND-COMMUNICATIONS": """# LCC — LINKAGES-CONTROL-AND-COMMUNICATIONS
 
 ## Purpose & Scope
 Scope: network, control loops, comms stacks (satcom, ground links), link-layer resilience.
@@ -334,7 +334,7 @@ Scope: network, control loops, comms stacks (satcom, ground links), link-layer r
 ## Local Decisions / Links / Change log
 - ...
 """,
-        "LIB-LOGISTICS-INVENTORY-AND-BLOCKCHAIN": """# LIB — LOGISTICS-INVENTORY-AND-BLOCKCHAIN
+    "LIB-LOGISTICS-INVENTORY-AND-BLOCKCHAIN": """# LIB — LOGISTICS-INVENTORY-AND-BLOCKCHAIN
 
 ## Purpose & Scope
 Scope: supply chain, inventory management, UTCS (tokenization), logistics optimization.
@@ -362,7 +362,7 @@ Scope: supply chain, inventory management, UTCS (tokenization), logistics optimi
 ## Local Decisions / Links / Change log
 - ...
 """,
-        "MMM-MECHANICS-MATERIALS-AND-MANUFACTURING": """# MMM — MECHANICS-MATERIALS-AND-MANUFACTURING
+    "MMM-MECHANICS-MATERIALS-AND-MANUFACTURING": """# MMM — MECHANICS-MATERIALS-AND-MANUFACTURING
 
 ## Purpose & Scope
 Scope: mechanical systems, materials, structural subsystems, fatigue and maintenance considerations.
@@ -390,7 +390,7 @@ Scope: mechanical systems, materials, structural subsystems, fatigue and mainten
 ## Local Decisions / Links / Change log
 - ...
 """,
-        "OOO-OS-ONTOLOGIES-AND-OFFICE-INTERFACES": """# OOO — OS-ONTOLOGIES-AND-OFFICE-INTERFACES
+    "OOO-OS-ONTOLOGIES-AND-OFFICE-INTERFACES": """# OOO — OS-ONTOLOGIES-AND-OFFICE-INTERFACES
 
 ## Purpose & Scope
 Scope: ontologies, data models, office interfaces (APIs), knowledge graphs supporting OPTIMO-DT.
@@ -418,7 +418,7 @@ Scope: ontologies, data models, office interfaces (APIs), knowledge graphs suppo
 ## Local Decisions / Links / Change log
 - ...
 """,
-        "PPP-PROPULSION-AND-FUEL-SYSTEMS": """# PPP — PROPULSION-AND-FUEL-SYSTEMS
+    "PPP-PROPULSION-AND-FUEL-SYSTEMS": """# PPP — PROPULSION-AND-FUEL-SYSTEMS
 
 ## Purpose & Scope
 Scope: propulsion architectures (jet, H2, hybrid-electric), fuel systems, fuel handling & interfaces.
@@ -446,17 +446,43 @@ Scope: propulsion architectures (jet, H2, hybrid-electric), fuel systems, fuel h
 ## Local Decisions / Links / Change log
 - ...
 """,
-    }
-
-    for code, content in stubs.items():
-        path = root / "2-DOMAINS-LEVELS" / code / "TFA" / "META"
-        path.mkdir(parents=True, exist_ok=True)
-        file = path / "README.md"
-        if file.exists():
-            print(f"Skipping existing: {file}")
+}
+
+def write_stub(domains_root: str, code: str, content: str) -> str:
+    """Create one domain's META README if missing and describe what was done"""
+    # Plain string joins; no intermediate Path objects per domain
+    path = f"{domains_root}{os.sep}{code}{os.sep}TFA{os.sep}META"
+    file = f"{path}{os.sep}README.md"
+    # One stat per domain; the directory is only created for new READMEs
+    if os.path.isfile(file):
+        return f"Skipping existing: {file}"
+    os.makedirs(path, exist_ok=True)
+    with open(file, "wb") as f:
+        f.write(content.encode("utf-8"))
+    return f"Created: {file}"
+
+def main():
+    root = Path('.').resolve()
+    domains_root = os.fspath(root / "2-DOMAINS-LEVELS")
+    # Only stub domains that exist on disk; a renamed or removed domain (or
+    # running from the wrong directory) must not create stray trees
+    try:
+        with os.scandir(domains_root) as entries:
+            present = {entry.name for entry in entries if entry.is_dir()}
+    except FileNotFoundError:
+        print(f"Domains directory not found: {domains_root}")
+        return
+    stubs = []
+    for code, content in STUBS.items():
+        if code in present:
+            stubs.append((code, content))
         else:
-            file.write_text(content, encoding="utf-8")
-            print(f"Created: {file}")
+            print(f"Skipping missing domain: {code}")
+    
+    # Domains are independent and the writes release the GIL
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        for message in executor.map(lambda item: write_stub(domains_root, *item), stubs):
+            print(message)
 
 if __name__ == "__main__":
     main()
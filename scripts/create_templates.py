@@ -5,39 +5,67 @@ Template Structure Generator for TFA V2
 Creates the comprehensive template system as specified
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 import yaml
 
+# Use the libyaml parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 REPO = Path(__file__).resolve().parents[1]
 TEMPLATES_DIR = REPO / "8-RESOURCES" / "TEMPLATES"
 LLC_MAP_FILE = REPO / "8-RESOURCES" / "llc-map.yaml"
 
+# LLC codes carrying each TFA metadata flag in the specification template
+QUANTUM_LLC_CODES = frozenset({"QB", "QS", "FWD"})
+CLASSICAL_BRIDGE_LLC_CODES = frozenset({"CB"})
+FEDERATION_LLC_CODES = frozenset({"FE"})
+
+def llc_template_values(llc_code: str, llc_name: str) -> dict:
+    """Per-LLC strings substituted into the layer templates."""
+    return {
+        "slug": f"{llc_code}-{llc_name.replace(' ', '-').replace('/', '-')}",
+        "quantum_enabled": "true" if llc_code in QUANTUM_LLC_CODES else "false",
+        "classical_bridge": "true" if llc_code in CLASSICAL_BRIDGE_LLC_CODES else "false",
+        "federation_capable": "true" if llc_code in FEDERATION_LLC_CODES else "false",
+        "id_regex": f"^[A-Z]{{3}}-{llc_code}-[0-9]{{3}}$",
+    }
+
+@lru_cache(maxsize=1)
 def load_llc_config():
-    """Load LLC configuration."""
-    with open(LLC_MAP_FILE, 'r') as f:
-        return yaml.safe_load(f)
-
-def create_tfa_layer_templates():
-    """Create TFA layer templates."""
-    config = load_llc_config()
-    tfa_layers = config['tfa_layers']
-    llc_codes = config['llc_codes']
-    
-    templates_root = TEMPLATES_DIR / "TFA-LAYER-TEMPLATES"
-    templates_root.mkdir(exist_ok=True)
+    """Load LLC configuration (parsed once per run; treat as read-only)."""
+    with open(LLC_MAP_FILE, 'rb') as f:
+        return yaml.load(f, Loader=_Loader)
+
+def write_if_changed(path: Path, payload: bytes) -> bool:
+    """Write payload unless path already holds exactly these bytes (keeps mtimes stable)."""
+    try:
+        # Size mismatch settles most changes without reading the file
+        if os.stat(path).st_size == len(payload) and path.read_bytes() == payload:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(payload)
+    return True
+
+def write_plan(directories, files):
+    """Create directories (parents listed first), then write all (path, bytes) files."""
+    for directory in directories:
+        directory.mkdir(exist_ok=True)
     
-    for layer_name, layer_config in tfa_layers.items():
-        layer_dir = templates_root / f"{layer_name}-TEMPLATES"
-        layer_dir.mkdir(exist_ok=True)
-        
-        if 'llc_codes' in layer_config:
-            for llc_code in layer_config['llc_codes']:
-                llc_name = llc_codes[llc_code]
-                llc_dir = layer_dir / f"{llc_code}-{llc_name.replace(' ', '-').replace('/', '-')}"
-                llc_dir.mkdir(exist_ok=True)
-                
-                # Create README template
-                readme_content = f"""# {llc_code} · {llc_name} Template
+    # Files are independent and the writes release the GIL
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(lambda item: write_if_changed(*item), files))
+
+def render_llc_templates(llc_dir: Path, layer_name: str, llc_code: str, llc_name: str, values: dict):
+    """Render the README and specification templates for one LLC code as (path, bytes) pairs."""
+    # Create README template
+    readme_content = f"""# {llc_code} · {llc_name} Template
 
 **Template Type:** TFA Layer Template  
 **LLC Code:** {llc_code}  
@@ -73,11 +101,10 @@ Standard placeholders used across templates:
 - `[DATE]` - ISO 8601 date
 - `[AUTHOR]` - Implementation author
 """
-                
-                (llc_dir / "README.template.md").write_text(readme_content)
-                
-                # Create basic YAML specification template
-                yaml_content = f"""# {llc_code} Specification Template
+    
+    
+    # Create basic YAML specification template
+    yaml_content = f"""# {llc_code} Specification Template
 metadata:
   template_version: "1.0"
   llc_code: "{llc_code}"
@@ -101,46 +128,66 @@ specification:
   tfa_metadata:
     layer: "{layer_name}"
     llc: "{llc_code}"
-    quantum_enabled: {'true' if llc_code in ['QB', 'QS', 'FWD'] else 'false'}
-    classical_bridge: {'true' if llc_code == 'CB' else 'false'}
-    federation_capable: {'true' if llc_code == 'FE' else 'false'}
+    quantum_enabled: {values["quantum_enabled"]}
+    classical_bridge: {values["classical_bridge"]}
+    federation_capable: {values["federation_capable"]}
 
 # Validation rules
 validation:
   required_fields: ["id", "description", "version"]
   format_rules:
-    id: "^[A-Z]{{3}}-{llc_code}-[0-9]{{3}}$"
+    id: "{values["id_regex"]}"
     version: "^[0-9]+\\.[0-9]+\\.[0-9]+$"
 """
-                
-                (llc_dir / "specification.template.yaml").write_text(yaml_content)
-
-def create_cax_lifecycle_templates():
-    """Create CAx lifecycle templates."""
-    cax_phases = [
-        ("CAB-BRAINSTORMING", "Concept capture and idea evaluation"),
-        ("CAC-COMPLIANCE-SAFETY", "Safety cases and compliance validation"),
-        ("CAD-DESIGN", "Design specifications and MBSE models"),
-        ("CAE-ENGINEERING", "Engineering analysis and simulations"),
-        ("CAF-FINANCE", "Financial models and blockchain economics"),
-        ("CAI-AI-INTEGRATION", "AI model integration and orchestration"),
-        ("CAM-MANUFACTURING", "Manufacturing plans and processes"),
-        ("CAO-ORGANIZATION", "Organizational structures and governance"),
-        ("CAP-PRODUCTION", "Production scheduling and optimization"),
-        ("CAS-SUSTAINMENT", "Maintenance plans and S1000D compliance"),
-        ("CAT-TESTING", "Test plans and validation procedures"),
-        ("CAV-VERIFICATION", "Verification and V&V processes")
+    
+    return [
+        (llc_dir / "README.template.md", readme_content.encode("utf-8")),
+        (llc_dir / "specification.template.yaml", yaml_content.encode("utf-8")),
     ]
+
+def create_tfa_layer_templates():
+    """Create TFA layer templates."""
+    config = load_llc_config()
+    tfa_layers = config['tfa_layers']
+    llc_codes = config['llc_codes']
+    llc_values = {code: llc_template_values(code, name) for code, name in llc_codes.items()}
     
-    cax_root = TEMPLATES_DIR / "CAX-LIFECYCLE-TEMPLATES"
-    cax_root.mkdir(exist_ok=True)
+    templates_root = TEMPLATES_DIR / "TFA-LAYER-TEMPLATES"
+    directories = [templates_root]
+    files = []
     
-    for phase_code, description in cax_phases:
-        phase_dir = cax_root / phase_code
-        phase_dir.mkdir(exist_ok=True)
+    for layer_name, layer_config in tfa_layers.items():
+        layer_dir = templates_root / f"{layer_name}-TEMPLATES"
+        directories.append(layer_dir)
         
-        # Create phase README
-        readme_content = f"""# {phase_code} Templates
+        if 'llc_codes' in layer_config:
+            for llc_code in layer_config['llc_codes']:
+                values = llc_values[llc_code]
+                llc_dir = layer_dir / values["slug"]
+                directories.append(llc_dir)
+                files.extend(render_llc_templates(llc_dir, layer_name, llc_code, llc_codes[llc_code], values))
+    
+    write_plan(directories, files)
+
+# CAx methodology phases: (phase directory, description)
+CAX_PHASES = (
+    ("CAB-BRAINSTORMING", "Concept capture and idea evaluation"),
+    ("CAC-COMPLIANCE-SAFETY", "Safety cases and compliance validation"),
+    ("CAD-DESIGN", "Design specifications and MBSE models"),
+    ("CAE-ENGINEERING", "Engineering analysis and simulations"),
+    ("CAF-FINANCE", "Financial models and blockchain economics"),
+    ("CAI-AI-INTEGRATION", "AI model integration and orchestration"),
+    ("CAM-MANUFACTURING", "Manufacturing plans and processes"),
+    ("CAO-ORGANIZATION", "Organizational structures and governance"),
+    ("CAP-PRODUCTION", "Production scheduling and optimization"),
+    ("CAS-SUSTAINMENT", "Maintenance plans and S1000D compliance"),
+    ("CAT-TESTING", "Test plans and validation procedures"),
+    ("CAV-VERIFICATION", "Verification and V&V processes"),
+)
+
+def render_cax_readme(phase_code: str, description: str) -> bytes:
+    """Render the README template for one CAx phase."""
+    return f"""# {phase_code} Templates
 
 **Phase:** {phase_code}  
 **Description:** {description}
@@ -159,30 +206,29 @@ This directory contains templates for the {phase_code} phase of the CAx methodol
 
 Templates in this directory support the {phase_code} phase activities across all domains
 and integrate with the TFA V2 architecture through domain-specific implementations.
-"""
-        
-        (phase_dir / "README.template.md").write_text(readme_content)
+""".encode("utf-8")
 
-def create_domain_specific_templates():
-    """Create domain-specific templates."""
-    config = load_llc_config()
-    domains = config['domains']
-    
-    domain_root = TEMPLATES_DIR / "DOMAIN-SPECIFIC-TEMPLATES"
-    domain_root.mkdir(exist_ok=True)
-    
-    # Create templates for key domains
-    key_domains = [
-        ("AAA-AERODYNAMICS-AND-AIRFRAMES-ARCHITECTURES", "Aerodynamic analysis and airframe structures"),
-        ("CQH-CRYOGENICS-QUANTUM-AND-H2", "Cryogenic systems, quantum computing, and hydrogen"),
-        ("IIS-INTEGRATED-INTELLIGENCE-SOFTWARE", "AI model architectures and software intelligence")
+def create_cax_lifecycle_templates():
+    """Create CAx lifecycle templates."""
+    cax_root = TEMPLATES_DIR / "CAX-LIFECYCLE-TEMPLATES"
+    phase_dirs = [cax_root / phase_code for phase_code, _description in CAX_PHASES]
+    files = [
+        (phase_dir / "README.template.md", render_cax_readme(phase_code, description))
+        for phase_dir, (phase_code, description) in zip(phase_dirs, CAX_PHASES)
     ]
     
-    for domain_code, description in key_domains:
-        domain_dir = domain_root / f"{domain_code}-TEMPLATES"
-        domain_dir.mkdir(exist_ok=True)
-        
-        readme_content = f"""# {domain_code} Domain Templates
+    write_plan([cax_root, *phase_dirs], files)
+
+# Domains with dedicated template sets: (domain directory, description)
+KEY_DOMAINS = (
+    ("AAA-AERODYNAMICS-AND-AIRFRAMES-ARCHITECTURES", "Aerodynamic analysis and airframe structures"),
+    ("CQH-CRYOGENICS-QUANTUM-AND-H2", "Cryogenic systems, quantum computing, and hydrogen"),
+    ("IIS-INTEGRATED-INTELLIGENCE-SOFTWARE", "AI model architectures and software intelligence"),
+)
+
+def render_domain_readme(domain_code: str, description: str) -> bytes:
+    """Render the README template for one key domain."""
+    return f"""# {domain_code} Domain Templates
 
 **Domain:** {domain_code}  
 **Description:** {description}
@@ -201,13 +247,21 @@ Templates customized for the unique requirements of the {domain_code} domain.
 
 These templates implement the complete TFA V2 quantum-classical architecture
 specifically tailored for {domain_code} domain requirements.
-"""
-        
-        (domain_dir / "README.template.md").write_text(readme_content)
+""".encode("utf-8")
 
-def create_usage_guide():
-    """Create template usage guide."""
-    guide_content = """# TFA V2 Template System Usage Guide
+def create_domain_specific_templates():
+    """Create domain-specific templates."""
+    domain_root = TEMPLATES_DIR / "DOMAIN-SPECIFIC-TEMPLATES"
+    domain_dirs = [domain_root / f"{domain_code}-TEMPLATES" for domain_code, _description in KEY_DOMAINS]
+    files = [
+        (domain_dir / "README.template.md", render_domain_readme(domain_code, description))
+        for domain_dir, (domain_code, description) in zip(domain_dirs, KEY_DOMAINS)
+    ]
+    
+    write_plan([domain_root, *domain_dirs], files)
+
+# Usage guide written to TEMPLATES_DIR, encoded once at import
+USAGE_GUIDE = """# TFA V2 Template System Usage Guide
 
 This guide explains how to use the comprehensive TFA V2 template system for creating
 consistent implementations across all domains and lifecycle phases.
@@ -316,25 +370,28 @@ For template system support:
 1. Check validation output: `python scripts/validate_tfa.py`
 2. Review LLC mapping: `8-RESOURCES/llc-map.yaml`
 3. Consult domain documentation in respective README files
-"""
-    
-    (TEMPLATES_DIR / "USAGE-GUIDE.md").write_text(guide_content)
+""".encode("utf-8")
+
+def create_usage_guide():
+    """Create template usage guide."""
+    write_if_changed(TEMPLATES_DIR / "USAGE-GUIDE.md", USAGE_GUIDE)
 
 def main():
     """Main template creation function."""
     print("🏗️ Creating TFA V2 template system...")
     
-    create_tfa_layer_templates()
-    print("✅ TFA layer templates created")
-    
-    create_cax_lifecycle_templates()
-    print("✅ CAx lifecycle templates created")
-    
-    create_domain_specific_templates()
-    print("✅ Domain-specific templates created")
-    
-    create_usage_guide()
-    print("✅ Usage guide created")
+    # The generators write disjoint trees, so run them side by side
+    generators = [
+        (create_tfa_layer_templates, "✅ TFA layer templates created"),
+        (create_cax_lifecycle_templates, "✅ CAx lifecycle templates created"),
+        (create_domain_specific_templates, "✅ Domain-specific templates created"),
+        (create_usage_guide, "✅ Usage guide created"),
+    ]
+    with ThreadPoolExecutor(max_workers=len(generators)) as executor:
+        futures = [(executor.submit(generate), message) for generate, message in generators]
+        for future, message in futures:
+            future.result()
+            print(message)
     
     print("🎯 TFA V2 template system creation complete!")
 
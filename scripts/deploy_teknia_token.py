@@ -12,16 +12,22 @@ Workflow:
 import json
 import argparse
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from web3 import Web3
 from eth_account import Account
 from dotenv import load_dotenv
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 load_dotenv()
 
 DEFAULT_ARTIFACT = "artifacts/contracts/TekniaToken.sol/TekniaToken.json"
 DEPLOYMENTS_DIR = Path("deployments")
-DEPLOYMENTS_DIR.mkdir(exist_ok=True)
 
 def parse_args():
     p = argparse.ArgumentParser()
@@ -33,6 +39,8 @@ def parse_args():
     p.add_argument("--provider", default=os.environ.get("WEB3_PROVIDER_URI", "http://127.0.0.1:8545"),
                    help="RPC endpoint")
     p.add_argument("--key", default=os.environ.get("DEPLOYER_KEY"), help="Deployer private key (hex)")
+    p.add_argument("--priority-fee-gwei", type=float, default=1.5,
+                   help="EIP-1559 priority fee (tip) in gwei")
     return p.parse_args()
 
 def main():
@@ -41,8 +49,8 @@ def main():
     if not artifact_path.exists():
         raise SystemExit(f"Artifact not found. Run `npx hardhat compile` first. Missing: {artifact_path}")
 
-    with artifact_path.open("r", encoding="utf-8") as fh:
-        artifact = json.load(fh)
+    raw = artifact_path.read_bytes()
+    artifact = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
 
     abi = artifact.get("abi")
     bytecode = artifact.get("bytecode")
@@ -58,8 +66,21 @@ def main():
         raise SystemExit("Set DEPLOYER_KEY env var or pass --key")
 
     acct = Account.from_key(deployer_key)
-    nonce = w3.eth.get_transaction_count(acct.address)
-    chain_id = w3.eth.chain_id
+    # Independent RPC reads; overlap their round-trips
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        nonce = pool.submit(w3.eth.get_transaction_count, acct.address)
+        chain_id = pool.submit(lambda: w3.eth.chain_id)
+        latest = pool.submit(w3.eth.get_block, "latest")
+        nonce, chain_id, latest = nonce.result(), chain_id.result(), latest.result()
+
+    base_fee = latest.get("baseFeePerGas")
+    if base_fee is not None:
+        # EIP-1559 chain: price locally; 2x base fee absorbs several full blocks of increases
+        tip = Web3.to_wei(args.priority_fee_gwei, "gwei")
+        fees = {"maxFeePerGas": 2 * base_fee + tip, "maxPriorityFeePerGas": tip}
+    else:
+        # Pre-London chain: legacy gas price
+        fees = {"gasPrice": w3.eth.gas_price}
 
     contract = w3.eth.contract(abi=abi, bytecode=bytecode)
     initial_supply_wei = args.initial_supply * (10 ** args.decimals)
@@ -68,7 +89,7 @@ def main():
         "from": acct.address,
         "nonce": nonce,
         "gas": 5_000_000,
-        "gasPrice": w3.eth.gas_price,
+        **fees,
         "chainId": chain_id
     })
 
@@ -89,6 +110,7 @@ def main():
                 "deployer": acct.address,
                 "chainId": chain_id
             }
+            DEPLOYMENTS_DIR.mkdir(exist_ok=True)
             fname = DEPLOYMENTS_DIR / f"teknia-{chain_id}.json"
             fname.write_text(json.dumps(out, indent=2), encoding="utf-8")
             print("Saved deployment info to", fname)
@@ -10,76 +10,126 @@ import hashlib
 import os
 import sys
 import time
-import yaml
+from collections import deque
 from pathlib import Path
-from typing import Dict, Any, List, Set
+from functools import lru_cache
+from typing import Dict, Any, FrozenSet, Iterable, Optional, Set, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
 def compute_sha256(file_path: Path) -> str:
     """Compute SHA256 hash of a file."""
-    if not file_path.exists():
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
         return "file_not_found"
-    
-    with open(file_path, 'rb') as f:
-        content = f.read()
-    return hashlib.sha256(content).hexdigest()
+    return _sha256_file(os.fspath(file_path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=32)
+def _sha256_file(path: str, mtime_ns: int, size: int) -> str:
+    """Stream a file through SHA256; cached until its mtime or size changes."""
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        digest = hashlib.sha256()
+        while chunk := f.read(1 << 16):
+            digest.update(chunk)
+    return digest.hexdigest()
 
 
-def get_changed_files() -> List[str]:
-    """Get list of changed files from git."""
+@lru_cache(maxsize=1)
+def get_changed_files() -> FrozenSet[str]:
+    """Get the set of changed files from git (one git call per process)."""
     import subprocess
+    git = ['git', '--no-optional-locks']
     try:
-        result = subprocess.run(['git', 'diff', '--name-only', 'HEAD~1'], 
-                              capture_output=True, text=True)
-        if result.returncode == 0:
-            return [line.strip() for line in result.stdout.split('\n') if line.strip()]
-        else:
+        result = subprocess.run(git + ['diff', '-z', '--name-only', '--no-renames', 'HEAD~1'],
+                                capture_output=True)
+        if result.returncode != 0:
             # Fallback for initial commit or other cases
-            result = subprocess.run(['git', 'ls-files'], 
-                                  capture_output=True, text=True)
-            return [line.strip() for line in result.stdout.split('\n') if line.strip()]
-    except:
-        return []
+            result = subprocess.run(git + ['ls-files', '-z'], capture_output=True)
+    except OSError:
+        return frozenset()
+    # NUL-separated output: no per-line stripping and newlines in paths survive
+    return frozenset(os.fsdecode(name) for name in result.stdout.split(b'\0') if name)
+
+
+# FCR-1 (Post-Base) triggers: exact files, path prefixes and path fragments
+FCR1_FILES = frozenset({
+    "services/mod-base/model_spec.yaml",
+    "services/mod-base/run_mod_base.py",
+})
+FCR1_PREFIXES = ("services/mod-base/data/",)
+FCR1_FRAGMENTS = ("/QUBITS/QB/", "/WAVES/FWD/")
+
+# FCR-2 (Stacks) triggers; covers services/mod-base/stack/mods/ as well
+FCR2_PREFIXES = ("services/mod-base/stack/",)
 
 
-def check_fcr1_triggers(changed_files: List[str]) -> bool:
+def _is_fcr1(file_path: str) -> bool:
+    return (file_path in FCR1_FILES
+            or file_path.startswith(FCR1_PREFIXES)
+            or any(fragment in file_path for fragment in FCR1_FRAGMENTS))
+
+
+def check_fcr1_triggers(changed_files: Iterable[str]) -> bool:
     """Check if any files trigger FCR-1 (Post-Base changes)."""
-    fcr1_triggers = {
-        "services/mod-base/model_spec.yaml",
-        "services/mod-base/run_mod_base.py",
-    }
-    
-    # Check for data changes
-    data_pattern = "services/mod-base/data/"
-    qb_pattern = "**/QUBITS/QB/**"
-    fwd_pattern = "**/WAVES/FWD/**"
-    
-    for file_path in changed_files:
-        if file_path in fcr1_triggers:
-            return True
-        if file_path.startswith(data_pattern):
-            return True
-        if "/QUBITS/QB/" in file_path:
-            return True
-        if "/WAVES/FWD/" in file_path:
-            return True
-    
-    return False
+    return any(map(_is_fcr1, changed_files))
 
 
-def check_fcr2_triggers(changed_files: List[str]) -> bool:
+def check_fcr2_triggers(changed_files: Iterable[str]) -> bool:
     """Check if any files trigger FCR-2 (Stacks)."""
-    stack_patterns = [
-        "services/mod-base/stack/",
-        "services/mod-base/stack/mods/"
-    ]
-    
+    return any(file_path.startswith(FCR2_PREFIXES) for file_path in changed_files)
+
+
+def detect_triggers(changed_files: Iterable[str]) -> Tuple[bool, bool]:
+    """Check FCR-1 and FCR-2 triggers in one pass over the changed files."""
+    fcr1 = fcr2 = False
     for file_path in changed_files:
-        for pattern in stack_patterns:
-            if file_path.startswith(pattern):
-                return True
+        fcr1 = fcr1 or _is_fcr1(file_path)
+        fcr2 = fcr2 or file_path.startswith(FCR2_PREFIXES)
+        if fcr1 and fcr2:
+            break
+    return fcr1, fcr2
+
+
+# UTC timestamp format used in the QS proof and change notice
+UTC_TIMESTAMP = '%Y-%m-%dT%H:%M:%SZ'
+
+# Lines of make output kept for the failure message
+MAKE_TAIL_LINES = 20
+
+
+def run_make(target: str, timeout: Optional[float] = None) -> Tuple[int, str]:
+    """Run a make target, streaming its output; return (returncode, output tail)."""
+    import subprocess
+    import threading
+    
+    tail = deque(maxlen=MAKE_TAIL_LINES)
+    proc = subprocess.Popen(['make', target], stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                            text=True, bufsize=1)
+    
+    def pump():
+        for line in proc.stdout:
+            print(f"     {line}", end="")
+            tail.append(line)
     
-    return False
+    reader = threading.Thread(target=pump, daemon=True)
+    reader.start()
+    try:
+        returncode = proc.wait(timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+    reader.join()
+    return returncode, "".join(tail)
 
 
 def execute_fcr1_actions() -> bool:
@@ -89,21 +139,21 @@ def execute_fcr1_actions() -> bool:
     try:
         # 1. Re-run MOD-BASE
         print("  1. Re-running MOD-BASE...")
-        import subprocess
-        result = subprocess.run(['make', 'mod-base'], capture_output=True, text=True)
-        if result.returncode != 0:
-            print(f"  ✗ MOD-BASE execution failed: {result.stderr}")
+        returncode, output = run_make('mod-base')
+        if returncode != 0:
+            print(f"  ✗ MOD-BASE execution failed: {output}")
             return False
         print("  ✓ MOD-BASE execution completed")
         
         # 2. Update QS proof with metrics hash
         print("  2. Updating QS proof...")
-        update_qs_proof()
+        now = time.time()
+        update_qs_proof(now)
         print("  ✓ QS proof updated")
         
         # 3. Update change notice
         print("  3. Updating change notice...")
-        update_change_notice("FCR-1 automatic update")
+        update_change_notice("FCR-1 automatic update", now)
         print("  ✓ Change notice updated")
         
         return True
@@ -122,12 +172,12 @@ def execute_fcr2_actions() -> bool:
         print("  1. Running stack composition...")
         import subprocess
         try:
-            result = subprocess.run(['make', 'mod-stack'], capture_output=True, text=True, timeout=300)
+            returncode, output = run_make('mod-stack', timeout=300)
         except subprocess.TimeoutExpired:
             print("  ✗ Stack composition timed out after 300 seconds.")
             return False
-        if result.returncode != 0:
-            print(f"  ✗ Stack composition failed: {result.stderr}")
+        if returncode != 0:
+            print(f"  ✗ Stack composition failed: {output}")
             return False
         print("  ✓ Stack composition completed")
         
@@ -143,43 +193,53 @@ def execute_fcr2_actions() -> bool:
         return False
 
 
-def update_qs_proof():
-    """Update QS proof with current metrics hash."""
-    qs_proof_path = Path("02-00-PORTFOLIO-ENTANGLEMENT/portfolio/2-DOMAINS-LEVELS/IIS-INTEGRATED-INTELLIGENCE-AND-SOFTWARE/programs/asi-t-core/conf_base/0001/gata/ata-31-instruments/cax-bridges/mlops/STATES/QS/qs-proof.json")
-    metrics_path = Path("services/mod-base/eval/metrics.json")
-    
-    if not metrics_path.exists():
+# MOD-BASE artifacts and the records that certify them
+SPEC_PATH = Path("services/mod-base/model_spec.yaml")
+DATA_PATH = Path("services/mod-base/data/sample_flight_plan.csv")
+METRICS_PATH = Path("services/mod-base/eval/metrics.json")
+EVIDENCE_PATH = Path("services/mod-base/qs/evidence.json")
+QS_PROOF_PATH = Path("02-00-PORTFOLIO-ENTANGLEMENT/portfolio/2-DOMAINS-LEVELS/IIS-INTEGRATED-INTELLIGENCE-AND-SOFTWARE/programs/asi-t-core/conf_base/0001/gata/ata-31-instruments/cax-bridges/mlops/STATES/QS/qs-proof.json")
+CHANGE_NOTICE_PATH = Path("change_notice.yaml")
+
+
+def update_qs_proof(now: Optional[float] = None):
+    """Update QS proof with current metrics hash (timestamped now, or the given epoch)."""
+    if not METRICS_PATH.exists():
         return
     
     # Get current metrics hash
-    metrics_hash = compute_sha256(metrics_path)
+    metrics_hash = compute_sha256(METRICS_PATH)
     
     # Update QS proof
-    if qs_proof_path.exists():
-        with open(qs_proof_path) as f:
-            proof = json.load(f)
+    if QS_PROOF_PATH.exists():
+        raw = QS_PROOF_PATH.read_bytes()
+        proof = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
         
         proof["evidence_chain"]["mod_base_metrics"] = metrics_hash
         proof["utcs_fields"]["decision_record"] = metrics_hash
-        proof["timestamp"] = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+        proof["timestamp"] = time.strftime(UTC_TIMESTAMP, time.gmtime(now))
         
-        with open(qs_proof_path, 'w') as f:
+        with open(QS_PROOF_PATH, 'w') as f:
             json.dump(proof, f, indent=2)
 
 
-def update_change_notice(reason: str):
-    """Update change notice with current hashes."""
-    change_notice_path = Path("change_notice.yaml")
+def update_change_notice(reason: str, now: Optional[float] = None):
+    """Update change notice with current hashes (timestamped now, or the given epoch)."""
+    # Only needed when FCR-1 fires; keep them off the trigger-check path
+    from concurrent.futures import ThreadPoolExecutor
+    import yaml
     
-    # Compute current hashes
-    spec_hash = compute_sha256(Path("services/mod-base/model_spec.yaml"))
-    data_hash = compute_sha256(Path("services/mod-base/data/sample_flight_plan.csv"))
-    metrics_hash = compute_sha256(Path("services/mod-base/eval/metrics.json"))
-    evidence_hash = compute_sha256(Path("services/mod-base/qs/evidence.json"))
+    # Compute current hashes (hashlib releases the GIL, so hash side by side)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        spec_hash, data_hash, metrics_hash, evidence_hash = executor.map(
+            compute_sha256, (SPEC_PATH, DATA_PATH, METRICS_PATH, EVIDENCE_PATH)
+        )
     
-    # Generate new CN ID
-    timestamp = time.strftime('%Y%m%d', time.gmtime())
-    cn_id = f"CN-{timestamp}-{int(time.time()) % 10000:04d}"
+    # Generate new CN ID from the same instant as the signoff timestamp
+    if now is None:
+        now = time.time()
+    utc = time.gmtime(now)
+    cn_id = f"CN-{time.strftime('%Y%m%d', utc)}-{int(now) % 10000:04d}"
     
     change_notice = {
         "cn_id": cn_id,
@@ -194,10 +254,10 @@ def update_change_notice(reason: str):
             "qs": True
         },
         "artifacts": {
-            "metrics_path": "services/mod-base/eval/metrics.json",
-            "evidence_path": "services/mod-base/qs/evidence.json",
-            "spec_path": "services/mod-base/model_spec.yaml",
-            "data_path": "services/mod-base/data/sample_flight_plan.csv"
+            "metrics_path": METRICS_PATH.as_posix(),
+            "evidence_path": EVIDENCE_PATH.as_posix(),
+            "spec_path": SPEC_PATH.as_posix(),
+            "data_path": DATA_PATH.as_posix()
         },
         "hashes": {
             "spec_sha256": spec_hash,
@@ -207,12 +267,14 @@ def update_change_notice(reason: str):
         },
         "signoff": {
             "operator_id": "fcr-automation",
-            "timestamp": time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+            "timestamp": time.strftime(UTC_TIMESTAMP, utc)
         }
     }
     
-    with open(change_notice_path, 'w') as f:
-        yaml.dump(change_notice, f, default_flow_style=False)
+    with open(CHANGE_NOTICE_PATH, 'w') as f:
+        # Use the libyaml emitter when PyYAML was built with it
+        yaml.dump(change_notice, f, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+                  default_flow_style=False)
 
 
 def main():
@@ -226,8 +288,9 @@ def main():
     changed_files = get_changed_files()
     print(f"📝 Detected {len(changed_files)} changed files")
     
-    fcr1_triggered = check_fcr1_triggers(changed_files) or args.force_fcr1
-    fcr2_triggered = check_fcr2_triggers(changed_files) or args.force_fcr2
+    fcr1_triggered, fcr2_triggered = detect_triggers(changed_files)
+    fcr1_triggered = fcr1_triggered or args.force_fcr1
+    fcr2_triggered = fcr2_triggered or args.force_fcr2
     
     if args.check_only:
         print(f"🔍 FCR-1 (Post-Base) triggered: {fcr1_triggered}")
@@ -7,41 +7,77 @@ integrating with the existing TFA V2 portfolio infrastructure.
 """
 
 import os
+import re
 import json
 import datetime
+from fnmatch import filter as fnfilter
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, Iterable, List, Any, Optional
+
+# A case study is complete once it records one of the three decisions
+CASE_DECISION = re.compile(rb"DECISION: (?:REUTILIZAR|REPARAR|RECICLAR)")
 
 class MasterProgressReporter:
+    # Objective key -> assessment method, in report order
+    OBJECTIVES = {
+        "audit": "_assess_audit_objective",                  # Objective 1: Repository Audit
+        "workflows": "_assess_workflow_objective",           # Objective 2: End-to-End Workflows
+        "eu_impact": "_assess_eu_impact_objective",          # Objective 3: European Impact
+        "collaboration": "_assess_collaboration_objective",  # Objective 4: Collaboration
+        "recognition": "_assess_recognition_objective",      # Objective 5: Recognition
+    }
+    
     def __init__(self, repo_root: Path):
         self.repo_root = repo_root
         self.framework_root = repo_root / "0-STRATEGY" / "MASTER-PROJECT-FRAMEWORK"
+    
+    @staticmethod
+    def _scan(path: str, depth: int) -> Dict[str, Optional[Dict]]:
+        """Map entry names under path to their subtree (directories) or None (files)."""
+        tree = {}
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        tree[entry.name] = MasterProgressReporter._scan(entry.path, depth - 1) if depth > 1 else {}
+                    else:
+                        tree[entry.name] = None
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+        return tree
+    
+    @cached_property
+    def _framework_tree(self) -> Dict[str, Optional[Dict]]:
+        """Framework layout down to objective/section/file, read with one scandir per directory."""
+        return self._scan(os.fspath(self.framework_root), 3)
+    
+    def _entries(self, *parts: str) -> Dict[str, Optional[Dict]]:
+        """Entries of a framework directory, empty if it does not exist."""
+        node = self._framework_tree
+        for part in parts:
+            node = node.get(part)
+            if node is None:
+                return {}
+        return node
+    
+    def _has_all(self, objective: str, *names: str) -> bool:
+        entries = self._entries(objective)
+        return all(name in entries for name in names)
+    
+    def _count(self, *parts: str, pattern: str = "*.md") -> int:
+        return len(fnfilter(self._entries(*parts), pattern))
         
     def generate_report(self) -> Dict[str, Any]:
         """Generate comprehensive progress report for all objectives."""
         report = {
             "generated_at": datetime.datetime.now().isoformat(),
-            "objectives": {},
+            "objectives": self.assess_objectives(),
             "overall_progress": 0,
             "next_actions": [],
             "risks_and_mitigations": []
         }
         
-        # Objective 1: Repository Audit
-        report["objectives"]["audit"] = self._assess_audit_objective()
-        
-        # Objective 2: End-to-End Workflows  
-        report["objectives"]["workflows"] = self._assess_workflow_objective()
-        
-        # Objective 3: European Impact
-        report["objectives"]["eu_impact"] = self._assess_eu_impact_objective()
-        
-        # Objective 4: Collaboration
-        report["objectives"]["collaboration"] = self._assess_collaboration_objective()
-        
-        # Objective 5: Recognition
-        report["objectives"]["recognition"] = self._assess_recognition_objective()
-        
         # Calculate overall progress
         total_progress = sum(obj["progress_percent"] for obj in report["objectives"].values())
         report["overall_progress"] = total_progress / len(report["objectives"])
@@ -52,30 +88,50 @@ class MasterProgressReporter:
         
         return report
     
+    def generate_report_partial(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Generate a report covering only the given objectives.
+        
+        Overall progress, next actions and risks span all objectives and are
+        left to generate_report().
+        """
+        return {
+            "generated_at": datetime.datetime.now().isoformat(),
+            "objectives": self.assess_objectives(keys)
+        }
+    
+    def assess_objectives(self, keys: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Assess the given objectives (all by default) in report order."""
+        if keys is None:
+            wanted = self.OBJECTIVES
+        else:
+            wanted = set(keys)
+            unknown = wanted - self.OBJECTIVES.keys()
+            if unknown:
+                raise KeyError(f"Unknown objectives: {', '.join(sorted(unknown))}")
+        return {
+            key: getattr(self, method)()
+            for key, method in self.OBJECTIVES.items() if key in wanted
+        }
+    
     def _assess_audit_objective(self) -> Dict[str, Any]:
         """Assess progress on Objective 1: Repository Audit."""
-        audit_dir = self.framework_root / "AUDIT"
-        
         # Check framework completeness
-        framework_complete = all([
-            (audit_dir / "README.md").exists(),
-            (audit_dir / "CHECKLIST.md").exists(),
-            (audit_dir / "AUTOMATED-REPORTS").exists(),
-            (audit_dir / "EXTERNAL-REVIEWS").exists()
-        ])
+        framework_complete = self._has_all(
+            "AUDIT", "README.md", "CHECKLIST.md", "AUTOMATED-REPORTS", "EXTERNAL-REVIEWS"
+        )
         
         # Check CI integration (simplified check for make targets)
         makefile = self.repo_root / "Makefile" 
         ci_integrated = makefile.exists() and "check" in makefile.read_text()
         
         # Check for external reviews
-        external_reviews = list((audit_dir / "EXTERNAL-REVIEWS").glob("*.md"))
+        external_reviews = self._count("AUDIT", "EXTERNAL-REVIEWS")
         
         progress_items = [
             ("Framework Documentation", framework_complete, 25),
             ("CI Integration", ci_integrated, 25), 
             ("Automated Reporting", False, 25),  # TODO: Implement
-            ("External Review Process", len(external_reviews) > 0, 25)
+            ("External Review Process", external_reviews > 0, 25)
         ]
         
         completed = sum(weight for _, complete, weight in progress_items if complete)
@@ -87,7 +143,7 @@ class MasterProgressReporter:
             "success_criteria": {
                 "automated_checks_green": ci_integrated,
                 "review_guide_published": framework_complete,
-                "audit_report_available": len(external_reviews) > 0
+                "audit_report_available": external_reviews > 0
             },
             "next_milestones": [
                 "Implement automated audit reporting",
@@ -98,21 +154,18 @@ class MasterProgressReporter:
     
     def _assess_workflow_objective(self) -> Dict[str, Any]:
         """Assess progress on Objective 2: End-to-End Workflows.""" 
-        workflows_dir = self.framework_root / "WORKFLOWS"
+        case_studies_dir = self.framework_root / "WORKFLOWS" / "CASE-STUDIES"
         
         # Check framework completeness
-        framework_complete = all([
-            (workflows_dir / "README.md").exists(),
-            (workflows_dir / "IDEA-TO-DECISION").exists(),
-            (workflows_dir / "CASE-STUDIES").exists(),
-            (workflows_dir / "TRACKING").exists()
-        ])
-        
-        # Count completed case studies
-        case_studies = list((workflows_dir / "CASE-STUDIES").glob("CASE-*.md"))
-        completed_cases = len([cs for cs in case_studies if "DECISION: REUTILIZAR" in cs.read_text() 
-                              or "DECISION: REPARAR" in cs.read_text() 
-                              or "DECISION: RECICLAR" in cs.read_text()])
+        framework_complete = self._has_all(
+            "WORKFLOWS", "README.md", "IDEA-TO-DECISION", "CASE-STUDIES", "TRACKING"
+        )
+        
+        # Count completed case studies (raw bytes, no decoding)
+        completed_cases = sum(
+            CASE_DECISION.search((case_studies_dir / name).read_bytes()) is not None
+            for name in fnfilter(self._entries("WORKFLOWS", "CASE-STUDIES"), "CASE-*.md")
+        )
         
         progress_items = [
             ("Workflow Documentation", framework_complete, 30),
@@ -148,20 +201,15 @@ class MasterProgressReporter:
     
     def _assess_eu_impact_objective(self) -> Dict[str, Any]:
         """Assess progress on Objective 3: European Impact."""
-        eu_impact_dir = self.framework_root / "EU-IMPACT"
-        
         # Check framework completeness 
-        framework_complete = all([
-            (eu_impact_dir / "README.md").exists(),
-            (eu_impact_dir / "PROPOSALS").exists(),
-            (eu_impact_dir / "PUBLICATIONS").exists(),
-            (eu_impact_dir / "STANDARDS").exists()
-        ])
+        framework_complete = self._has_all(
+            "EU-IMPACT", "README.md", "PROPOSALS", "PUBLICATIONS", "STANDARDS"
+        )
         
         # Count deliverables (simplified - would scan actual files in real implementation)
-        proposals_submitted = len(list((eu_impact_dir / "PROPOSALS").glob("*.md")))
-        publications_published = len(list((eu_impact_dir / "PUBLICATIONS").glob("*.md")))
-        standards_contributions = len(list((eu_impact_dir / "STANDARDS").glob("*.md")))
+        proposals_submitted = self._count("EU-IMPACT", "PROPOSALS")
+        publications_published = self._count("EU-IMPACT", "PUBLICATIONS")
+        standards_contributions = self._count("EU-IMPACT", "STANDARDS")
         
         progress_items = [
             ("Framework Documentation", framework_complete, 25),
@@ -197,19 +245,14 @@ class MasterProgressReporter:
     
     def _assess_collaboration_objective(self) -> Dict[str, Any]:
         """Assess progress on Objective 4: Collaboration and Network."""
-        collab_dir = self.framework_root / "COLLABORATION"
-        
-        framework_complete = all([
-            (collab_dir / "README.md").exists(),
-            (collab_dir / "AGREEMENTS").exists(),
-            (collab_dir / "MENTORSHIP").exists(), 
-            (collab_dir / "MODULE-PROPOSALS").exists()
-        ])
+        framework_complete = self._has_all(
+            "COLLABORATION", "README.md", "AGREEMENTS", "MENTORSHIP", "MODULE-PROPOSALS"
+        )
         
         # Count collaboration artifacts
-        agreements_signed = len(list((collab_dir / "AGREEMENTS").glob("*.md")))
-        mentors_engaged = len(list((collab_dir / "MENTORSHIP").glob("*.md")))
-        module_proposals = len(list((collab_dir / "MODULE-PROPOSALS").glob("*.md")))
+        agreements_signed = self._count("COLLABORATION", "AGREEMENTS")
+        mentors_engaged = self._count("COLLABORATION", "MENTORSHIP")
+        module_proposals = self._count("COLLABORATION", "MODULE-PROPOSALS")
         
         progress_items = [
             ("Framework Documentation", framework_complete, 25),
@@ -245,19 +288,14 @@ class MasterProgressReporter:
     
     def _assess_recognition_objective(self) -> Dict[str, Any]:
         """Assess progress on Objective 5: Recognition and Reference Building."""
-        recognition_dir = self.framework_root / "RECOGNITION"
-        
-        framework_complete = all([
-            (recognition_dir / "README.md").exists(),
-            (recognition_dir / "CASE-STUDIES").exists(),
-            (recognition_dir / "PRESENTATIONS").exists(),
-            (recognition_dir / "ROADMAP").exists()
-        ])
+        framework_complete = self._has_all(
+            "RECOGNITION", "README.md", "CASE-STUDIES", "PRESENTATIONS", "ROADMAP"
+        )
         
         # Count recognition activities
-        presentations = len(list((recognition_dir / "PRESENTATIONS").glob("*.md"))) 
-        case_studies = len(list((recognition_dir / "CASE-STUDIES").glob("*.md")))
-        roadmap_exists = (recognition_dir / "ROADMAP" / "scaling-roadmap.md").exists()
+        presentations = self._count("RECOGNITION", "PRESENTATIONS")
+        case_studies = self._count("RECOGNITION", "CASE-STUDIES")
+        roadmap_exists = "scaling-roadmap.md" in self._entries("RECOGNITION", "ROADMAP")
         
         progress_items = [
             ("Framework Documentation", framework_complete, 30),
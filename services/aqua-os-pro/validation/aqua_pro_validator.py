@@ -222,6 +222,9 @@ class AquaProValidator:
         logger.info("Validating implementations...")
         
         domains_path = self.portfolio_root / "2-DOMAINS-LEVELS"
+        # Layer modules import the shared aqua_pro_base core from this directory
+        if str(domains_path) not in sys.path:
+            sys.path.append(str(domains_path))
         
         for domain_code in self.domains:
             domain_name = self._get_domain_name(domain_code)
@@ -237,35 +240,7 @@ class AquaProValidator:
                         content = impl_file.read_text(encoding='utf-8')
                         compile(content, str(impl_file), 'exec')
                         
-                        # Check for required classes and functions
-                        required_elements = [
-                            f"class AquaPro{layer_code}Interface",
-                            f"class AquaPro{layer_code}Implementation",
-                            "def initialize(",
-                            "def process(",
-                            "def get_status("
-                        ]
-                        
-                        missing_elements = []
-                        for element in required_elements:
-                            if element not in content:
-                                missing_elements.append(element)
-                        
-                        if missing_elements:
-                            self.validation_results.append(ValidationResult(
-                                component=f"IMPL.{domain_code}.{layer_code}",
-                                status="warning",
-                                message="Missing required elements",
-                                details={"missing": missing_elements}
-                            ))
-                        else:
-                            self.validation_results.append(ValidationResult(
-                                component=f"IMPL.{domain_code}.{layer_code}",
-                                status="pass",
-                                message="Implementation structure valid"
-                            ))
-                            
-                        # Try to import the module
+                        # Import the module; layer modules may delegate to the shared aqua_pro_base core
                         try:
                             spec = importlib.util.spec_from_file_location(
                                 f"{domain_code}_{layer_code}", impl_file)
@@ -283,6 +258,28 @@ class AquaProValidator:
                                 status="fail",
                                 message=f"Import error: {e}"
                             ))
+                            continue
+                        
+                        # Check for required classes and methods on the loaded module
+                        impl_class = getattr(module, f"AquaPro{layer_code}Implementation", None)
+                        missing_elements = [] if impl_class else [f"AquaPro{layer_code}Implementation"]
+                        for method in ("initialize", "process", "get_status"):
+                            if impl_class and not callable(getattr(impl_class, method, None)):
+                                missing_elements.append(method)
+                        
+                        if missing_elements:
+                            self.validation_results.append(ValidationResult(
+                                component=f"IMPL.{domain_code}.{layer_code}",
+                                status="warning",
+                                message="Missing required elements",
+                                details={"missing": missing_elements}
+                            ))
+                        else:
+                            self.validation_results.append(ValidationResult(
+                                component=f"IMPL.{domain_code}.{layer_code}",
+                                status="pass",
+                                message="Implementation structure valid"
+                            ))
                             
                     except SyntaxError as e:
                         self.validation_results.append(ValidationResult(